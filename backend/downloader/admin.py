@@ -3,12 +3,14 @@ from django.contrib.auth.models import User, Group
 from django.utils.html import format_html
 from django.contrib import messages
 from django.db import IntegrityError
+from django.db.models import Count, Q
 from django.utils import timezone
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
 from .models import VideoDownload, AIProviderSettings
 from .utils import (
-    perform_extraction, extract_video_id, translate_text, download_file, 
-    process_video_with_ai, transcribe_video, add_caption_to_video, 
+    perform_extraction, extract_video_id, translate_text, download_file,
+    run_ai_processing, transcribe_video, add_caption_to_video,
     extract_thumbnail_from_video, trim_video_segment
 )
 
@@ -16,6 +18,70 @@ from .utils import (
 admin.site.unregister(User)
 admin.site.unregister(Group)
 
+# Badge color/label tables, built once — the badge renderers below run
+# per row on every changelist load
+STATUS_BADGE_COLORS = {
+    'success': 'green',
+    'failed': 'red',
+    'pending': 'orange'
+}
+
+TRANSCRIPTION_BADGE_COLORS = {
+    'not_transcribed': '#6c757d',  # gray
+    'transcribing': '#ffc107',     # yellow
+    'transcribed': '#28a745',      # green
+    'failed': '#dc3545'            # red
+}
+
+TRANSCRIPTION_BADGE_LABELS = {
+    'not_transcribed': 'Not Transcribed',
+    'transcribing': 'Transcribing',
+    'transcribed': 'Transcribed',
+    'failed': 'Failed'
+}
+
+TRANSCRIPTION_BADGE_ICONS = {
+    'transcribed': '📝 ',
+    'transcribing': '⟳ ',
+    'failed': '✗ '
+}
+
+AI_BADGE_COLORS = {
+    'not_processed': '#6c757d',  # gray
+    'processing': '#ffc107',     # yellow
+    'processed': '#28a745',      # green
+    'failed': '#dc3545'          # red
+}
+
+AI_BADGE_LABELS = {
+    'not_processed': 'Not Processed',
+    'processing': 'Processing',
+    'processed': 'Processed',
+    'failed': 'Failed'
+}
+
+AI_BADGE_ICONS = {
+    'processed': '✓ ',
+    'processing': '⟳ ',
+    'failed': '✗ '
+}
+
+# Action-button markup per status, keyed for download_button. The {}
+# placeholder (where present) receives the per-video action URL.
+TRANSCRIBE_BUTTON_SPECS = {
+    'not_transcribed': '<a class="button" href="{}" style="background-color: #17a2b8; color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none; margin-right: 5px;">📝 Transcribe</a>',
+    'transcribing': '<a class="button" style="background-color: #ffc107; color: #212529; padding: 5px 10px; border-radius: 4px; text-decoration: none; pointer-events: none; margin-right: 5px;">⟳ Transcribing</a>',
+    'transcribed': '<a class="button" style="background-color: #28a745; color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none; pointer-events: none; margin-right: 5px;">✓ Transcribed</a>',
+    'failed': '<a class="button" href="{}" style="background-color: #dc3545; color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none; margin-right: 5px;">✗ Retry Transcribe</a>',
+}
+
+AI_BUTTON_SPECS = {
+    'not_processed': '<a class="button" href="{}" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none;">🤖 Process AI</a>',
+    'processing': '<a class="button" style="background-color: #ffc107; color: #212529; padding: 5px 10px; border-radius: 4px; text-decoration: none; pointer-events: none;">⟳ Processing</a>',
+    'processed': '<a class="button" style="background-color: #28a745; color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none; pointer-events: none;">✓ AI Done</a>',
+    'failed': '<a class="button" href="{}" style="background-color: #dc3545; color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none;">✗ Retry AI</a>',
+}
+
 @admin.register(AIProviderSettings)
 class AIProviderSettingsAdmin(admin.ModelAdmin):
     """Admin interface for AI Provider Settings"""
@@ -42,33 +108,35 @@ class VideoDownloadAdmin(admin.ModelAdmin):
     
     change_list_template = 'admin/downloader/videodownload/change_list.html'
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        # The changelist only renders hot columns (statuses, urls, timestamps);
+        # skip the transcript/description blobs there. The change form still
+        # loads the full row.
+        match = request.resolver_match
+        if match and match.url_name == 'downloader_videodownload_changelist':
+            qs = qs.hot()
+        return qs
+
     def changelist_view(self, request, extra_context=None):
-        # Calculate stats
-        total_videos = VideoDownload.objects.count()
-        downloaded_count = VideoDownload.objects.filter(is_downloaded=True).count()
-        cloud_only_count = total_videos - downloaded_count
-        success_count = VideoDownload.objects.filter(status='success').count()
-        failed_count = VideoDownload.objects.filter(status='failed').count()
-        pending_count = VideoDownload.objects.filter(status='pending').count()
-        
-        # AI Processing stats
-        ai_processed_count = VideoDownload.objects.filter(ai_processing_status='processed').count()
-        ai_processing_count = VideoDownload.objects.filter(ai_processing_status='processing').count()
-        ai_not_processed_count = VideoDownload.objects.filter(ai_processing_status='not_processed').count()
-        ai_failed_count = VideoDownload.objects.filter(ai_processing_status='failed').count()
-        
+        # Calculate stats in a single aggregate query instead of one
+        # COUNT(*) round trip per stat
+        stats = VideoDownload.objects.aggregate(
+            total_videos=Count('pk'),
+            downloaded_count=Count('pk', filter=Q(is_downloaded=True)),
+            success_count=Count('pk', filter=Q(status='success')),
+            failed_count=Count('pk', filter=Q(status='failed')),
+            pending_count=Count('pk', filter=Q(status='pending')),
+            ai_processed_count=Count('pk', filter=Q(ai_processing_status='processed')),
+            ai_processing_count=Count('pk', filter=Q(ai_processing_status='processing')),
+            ai_not_processed_count=Count('pk', filter=Q(ai_processing_status='not_processed')),
+            ai_failed_count=Count('pk', filter=Q(ai_processing_status='failed')),
+        )
+        stats['cloud_only_count'] = stats['total_videos'] - stats['downloaded_count']
+
         extra_context = extra_context or {}
-        extra_context['total_videos'] = total_videos
-        extra_context['downloaded_count'] = downloaded_count
-        extra_context['cloud_only_count'] = cloud_only_count
-        extra_context['success_count'] = success_count
-        extra_context['failed_count'] = failed_count
-        extra_context['pending_count'] = pending_count
-        extra_context['ai_processed_count'] = ai_processed_count
-        extra_context['ai_processing_count'] = ai_processing_count
-        extra_context['ai_not_processed_count'] = ai_not_processed_count
-        extra_context['ai_failed_count'] = ai_failed_count
-        
+        extra_context.update(stats)
+
         return super().changelist_view(request, extra_context=extra_context)
 
     list_display = [
@@ -238,8 +306,8 @@ class VideoDownloadAdmin(admin.ModelAdmin):
                 existing = VideoDownload.objects.filter(video_id=video_id).first()
                 if existing:
                     messages.error(request, format_html(
-                        "Video with ID '{}' already exists! <a href='/admin/downloader/videodownload/{}/change/'>View existing record</a>",
-                        video_id, existing.pk
+                        "Video with ID '{}' already exists! <a href='{}'>View existing record</a>",
+                        video_id, reverse('admin:downloader_videodownload_change', args=[existing.pk])
                     ))
                     # Don't save, return early
                     return
@@ -292,8 +360,8 @@ class VideoDownloadAdmin(admin.ModelAdmin):
                     existing = VideoDownload.objects.filter(video_id=obj.video_id).first()
                     if existing:
                         messages.error(request, format_html(
-                            "Video with ID '{}' already exists! <a href='/admin/downloader/videodownload/{}/change/'>View existing record</a>",
-                            obj.video_id, existing.pk
+                            "Video with ID '{}' already exists! <a href='{}'>View existing record</a>",
+                            obj.video_id, reverse('admin:downloader_videodownload_change', args=[existing.pk])
                         ))
                     else:
                         messages.error(request, f"Duplicate video ID detected: '{obj.video_id}'. This may be a race condition.")
@@ -328,16 +396,19 @@ class VideoDownloadAdmin(admin.ModelAdmin):
     
     def transcribe_video_action(self, request, queryset):
         """Action to transcribe videos"""
-        # Redirect to bulk transcription page
-        selected_ids = ','.join(str(obj.pk) for obj in queryset)
-        return redirect(f'/admin/downloader/videodownload/transcribe/?ids={selected_ids}')
+        # Redirect to bulk transcription page; values_list avoids hydrating
+        # full rows just to collect pks
+        selected_ids = ','.join(str(pk) for pk in queryset.values_list('pk', flat=True))
+        url = reverse('admin:downloader_videodownload_transcribe_bulk')
+        return redirect(f'{url}?ids={selected_ids}')
     transcribe_video_action.short_description = "Transcribe Selected Videos"
-    
+
     def process_with_ai_action(self, request, queryset):
         """Action to process videos with AI"""
         # Redirect to bulk processing page
-        selected_ids = ','.join(str(obj.pk) for obj in queryset)
-        return redirect(f'/admin/downloader/videodownload/process-ai/?ids={selected_ids}')
+        selected_ids = ','.join(str(pk) for pk in queryset.values_list('pk', flat=True))
+        url = reverse('admin:downloader_videodownload_process_ai_bulk')
+        return redirect(f'{url}?ids={selected_ids}')
     process_with_ai_action.short_description = "Process Selected Videos with AI"
     
     def add_caption_action(self, request, queryset):
@@ -388,35 +459,14 @@ class VideoDownloadAdmin(admin.ModelAdmin):
         if obj.ai_processing_status == 'processing':
             messages.warning(request, "This video is already being processed.")
             return redirect('admin:downloader_videodownload_changelist')
-        
-        # Set status to processing
-        obj.ai_processing_status = 'processing'
-        obj.save()
-        
-        try:
-            # Process with AI
-            result = process_video_with_ai(obj)
-            
-            if result['status'] == 'success':
-                obj.ai_processing_status = 'processed'
-                obj.ai_summary = result['summary']
-                obj.ai_tags = ', '.join(result['tags'])
-                obj.ai_processed_at = timezone.now()
-                obj.ai_error_message = ''
-                messages.success(request, f"Successfully processed video with AI: {obj.title}")
-            else:
-                obj.ai_processing_status = 'failed'
-                obj.ai_error_message = result.get('error', 'Unknown error')
-                messages.error(request, f"AI processing failed: {result.get('error', 'Unknown error')}")
-            
-            obj.save()
-            
-        except Exception as e:
-            obj.ai_processing_status = 'failed'
-            obj.ai_error_message = str(e)
-            obj.save()
-            messages.error(request, f"AI processing error: {str(e)}")
-        
+
+        result = run_ai_processing(obj)
+
+        if result['status'] == 'success':
+            messages.success(request, f"Successfully processed video with AI: {obj.title}")
+        else:
+            messages.error(request, f"AI processing failed: {result.get('error', 'Unknown error')}")
+
         return redirect('admin:downloader_videodownload_changelist')
     
     def process_ai_bulk_view(self, request):
@@ -438,31 +488,12 @@ class VideoDownloadAdmin(admin.ModelAdmin):
                 for obj in videos:
                     if obj.ai_processing_status == 'processing':
                         continue
-                    
-                    obj.ai_processing_status = 'processing'
-                    obj.save()
-                    
-                    try:
-                        result = process_video_with_ai(obj)
-                        
-                        if result['status'] == 'success':
-                            obj.ai_processing_status = 'processed'
-                            obj.ai_summary = result['summary']
-                            obj.ai_tags = ', '.join(result['tags'])
-                            obj.ai_processed_at = timezone.now()
-                            obj.ai_error_message = ''
-                            success_count += 1
-                        else:
-                            obj.ai_processing_status = 'failed'
-                            obj.ai_error_message = result.get('error', 'Unknown error')
-                            failed_count += 1
-                        
-                        obj.save()
-                        
-                    except Exception as e:
-                        obj.ai_processing_status = 'failed'
-                        obj.ai_error_message = str(e)
-                        obj.save()
+
+                    result = run_ai_processing(obj)
+
+                    if result['status'] == 'success':
+                        success_count += 1
+                    else:
                         failed_count += 1
                 
                 messages.success(
@@ -602,11 +633,18 @@ class VideoDownloadAdmin(admin.ModelAdmin):
             return JsonResponse({'error': 'Permission denied'}, status=403)
         
         try:
-            obj = get_object_or_404(VideoDownload, pk=pk)
-            
+            # Polled every few seconds by the transcribe page JS — read a
+            # dict of the four fields instead of hydrating the full model
+            obj = VideoDownload.objects.filter(pk=pk).values(
+                'transcription_status', 'transcript_started_at',
+                'transcript', 'transcript_error_message',
+            ).first()
+            if obj is None:
+                return JsonResponse({'error': 'Video not found'}, status=404)
+
             elapsed_seconds = 0
-            if obj.transcript_started_at:
-                elapsed = timezone.now() - obj.transcript_started_at
+            if obj['transcript_started_at']:
+                elapsed = timezone.now() - obj['transcript_started_at']
                 elapsed_seconds = int(elapsed.total_seconds())
             
             # Format elapsed time
@@ -622,11 +660,11 @@ class VideoDownloadAdmin(admin.ModelAdmin):
                 elapsed_display = f"{hours}h {minutes}m"
             
             response = JsonResponse({
-                'status': obj.transcription_status,
+                'status': obj['transcription_status'],
                 'elapsed_seconds': elapsed_seconds,
                 'elapsed_display': elapsed_display,
-                'has_transcript': bool(obj.transcript),
-                'error': obj.transcript_error_message if obj.transcription_status == 'failed' else None
+                'has_transcript': bool(obj['transcript']),
+                'error': obj['transcript_error_message'] if obj['transcription_status'] == 'failed' else None
             })
             # Ensure proper content type header
             response['Content-Type'] = 'application/json'
@@ -653,41 +691,17 @@ class VideoDownloadAdmin(admin.ModelAdmin):
     title_display.short_description = "Title"
     
     def status_badge(self, obj):
-        colors = {
-            'success': 'green',
-            'failed': 'red',
-            'pending': 'orange'
-        }
         return format_html(
             '<span style="background-color: {}; color: white; padding: 3px 10px; border-radius: 10px; font-size: 12px;">{}</span>',
-            colors.get(obj.status, 'gray'),
+            STATUS_BADGE_COLORS.get(obj.status, 'gray'),
             obj.status.upper()
         )
     status_badge.short_description = "Status"
     
     def transcription_status_badge(self, obj):
-        from django.utils import timezone
-        colors = {
-            'not_transcribed': '#6c757d',  # gray
-            'transcribing': '#ffc107',     # yellow
-            'transcribed': '#28a745',      # green
-            'failed': '#dc3545'            # red
-        }
-        labels = {
-            'not_transcribed': 'Not Transcribed',
-            'transcribing': 'Transcribing',
-            'transcribed': 'Transcribed',
-            'failed': 'Failed'
-        }
         status = obj.transcription_status
-        icon = ''
-        if status == 'transcribed':
-            icon = '📝 '
-        elif status == 'transcribing':
-            icon = '⟳ '
-        elif status == 'failed':
-            icon = '✗ '
-        
+        icon = TRANSCRIPTION_BADGE_ICONS.get(status, '')
+
         # Calculate and display elapsed time if transcribing
         elapsed_text = ''
         if status == 'transcribing' and obj.transcript_started_at:
@@ -712,41 +726,21 @@ class VideoDownloadAdmin(admin.ModelAdmin):
         return format_html(
             '<span id="transcribe-status-{}" style="background-color: {}; color: white; padding: 3px 10px; border-radius: 10px; font-size: 11px; display: inline-block;"{}>{}{}{}</span>',
             obj.pk,
-            colors.get(status, '#6c757d'),
+            TRANSCRIPTION_BADGE_COLORS.get(status, '#6c757d'),
             data_attr,
             icon,
-            labels.get(status, status.title()),
+            TRANSCRIPTION_BADGE_LABELS.get(status, status.title()),
             elapsed_text
         )
     transcription_status_badge.short_description = "Transcript"
     
     def ai_status_badge(self, obj):
-        colors = {
-            'not_processed': '#6c757d',  # gray
-            'processing': '#ffc107',     # yellow
-            'processed': '#28a745',      # green
-            'failed': '#dc3545'          # red
-        }
-        labels = {
-            'not_processed': 'Not Processed',
-            'processing': 'Processing',
-            'processed': 'Processed',
-            'failed': 'Failed'
-        }
         status = obj.ai_processing_status
-        icon = ''
-        if status == 'processed':
-            icon = '✓ '
-        elif status == 'processing':
-            icon = '⟳ '
-        elif status == 'failed':
-            icon = '✗ '
-        
         return format_html(
             '<span style="background-color: {}; color: white; padding: 3px 10px; border-radius: 10px; font-size: 11px; display: inline-block;">{}{}</span>',
-            colors.get(status, '#6c757d'),
-            icon,
-            labels.get(status, status.title())
+            AI_BADGE_COLORS.get(status, '#6c757d'),
+            AI_BADGE_ICONS.get(status, ''),
+            AI_BADGE_LABELS.get(status, status.title())
         )
     ai_status_badge.short_description = "AI Status"
     
@@ -759,7 +753,6 @@ class VideoDownloadAdmin(admin.ModelAdmin):
     download_status.short_description = "Storage"
 
     def download_button(self, obj):
-        from django.urls import reverse
         buttons = []
         
         # Download button
@@ -776,51 +769,18 @@ class VideoDownloadAdmin(admin.ModelAdmin):
                 download_url
             ))
         
-        # Transcription button
+        # Transcription / AI buttons — table-driven instead of elif
+        # cascades per status
         if obj.status == 'success':
-            transcribe_url = reverse('admin:downloader_videodownload_transcribe', args=[obj.pk])
-            if obj.transcription_status == 'not_transcribed':
-                buttons.append(format_html(
-                    '<a class="button" href="{}" style="background-color: #17a2b8; color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none; margin-right: 5px;">📝 Transcribe</a>',
-                    transcribe_url
-                ))
-            elif obj.transcription_status == 'transcribing':
-                buttons.append(format_html(
-                    '<a class="button" style="background-color: #ffc107; color: #212529; padding: 5px 10px; border-radius: 4px; text-decoration: none; pointer-events: none; margin-right: 5px;">⟳ Transcribing</a>'
-                ))
-            elif obj.transcription_status == 'transcribed':
-                buttons.append(format_html(
-                    '<a class="button" style="background-color: #28a745; color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none; pointer-events: none; margin-right: 5px;">✓ Transcribed</a>'
-                ))
-            elif obj.transcription_status == 'failed':
-                buttons.append(format_html(
-                    '<a class="button" href="{}" style="background-color: #dc3545; color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none; margin-right: 5px;">✗ Retry Transcribe</a>',
-                    transcribe_url
-                ))
-        
-        # AI Processing button
-        if obj.status == 'success':
-            ai_url = reverse('admin:downloader_videodownload_process_ai', args=[obj.pk])
-            if obj.ai_processing_status == 'not_processed':
-                buttons.append(format_html(
-                    '<a class="button" href="{}" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none;">🤖 Process AI</a>',
-                    ai_url
-                ))
-            elif obj.ai_processing_status == 'processing':
-                buttons.append(format_html(
-                    '<a class="button" style="background-color: #ffc107; color: #212529; padding: 5px 10px; border-radius: 4px; text-decoration: none; pointer-events: none;">⟳ Processing</a>'
-                ))
-            elif obj.ai_processing_status == 'processed':
-                buttons.append(format_html(
-                    '<a class="button" style="background-color: #28a745; color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none; pointer-events: none;">✓ AI Done</a>'
-                ))
-            elif obj.ai_processing_status == 'failed':
-                buttons.append(format_html(
-                    '<a class="button" href="{}" style="background-color: #dc3545; color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none;">✗ Retry AI</a>',
-                    ai_url
-                ))
-        
+            for specs, route_name, current_status in (
+                (TRANSCRIBE_BUTTON_SPECS, 'admin:downloader_videodownload_transcribe', obj.transcription_status),
+                (AI_BUTTON_SPECS, 'admin:downloader_videodownload_process_ai', obj.ai_processing_status),
+            ):
+                template = specs.get(current_status)
+                if template:
+                    # Unused for the static (pointer-events: none) buttons
+                    action_url = reverse(route_name, args=[obj.pk])
+                    buttons.append(format_html(template, action_url))
 
-        
         return format_html(''.join(buttons)) if buttons else "-"
     download_button.short_description = "Actions"
@@ -0,0 +1,48 @@
+"""Custom model fields for the downloader app."""
+import zlib
+
+from django.db import models
+
+
+class CompressedTextField(models.BinaryField):
+    """Drop-in replacement for TextField that stores zlib-compressed UTF-8.
+
+    Transcripts are many KB of repetitive text, so compressing at the
+    column boundary cuts the bytes moved through the ORM (and the on-disk
+    row size) by roughly 3-5x. Code reading or writing the field keeps
+    working with plain ``str``; compression is invisible above the field.
+
+    Rows written before the column was compressed are returned as-is,
+    so swapping a TextField for this field does not require rewriting
+    old data up front.
+    """
+
+    description = "Text stored as zlib-compressed bytes"
+    empty_strings_allowed = True
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('editable', True)
+        super().__init__(*args, **kwargs)
+
+    def get_prep_value(self, value):
+        if isinstance(value, str):
+            value = zlib.compress(value.encode('utf-8')) if value else b''
+        return super().get_prep_value(value)
+
+    def from_db_value(self, value, expression, connection):
+        return self.to_python(value)
+
+    def to_python(self, value):
+        if value is None or isinstance(value, str):
+            return value
+        value = bytes(value)
+        if not value:
+            return ''
+        try:
+            return zlib.decompress(value).decode('utf-8')
+        except (zlib.error, UnicodeDecodeError):
+            # Legacy row stored as raw text before the field was compressed
+            return value.decode('utf-8', errors='replace')
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
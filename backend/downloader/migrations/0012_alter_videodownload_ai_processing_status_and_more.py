@@ -0,0 +1,50 @@
+# Generated by Django 4.2.26 on 2026-08-27 14:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('downloader', '0011_savedvoice'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='videodownload',
+            name='ai_processing_status',
+            field=models.CharField(choices=[('not_processed', 'Not Processed'), ('processing', 'Processing'), ('processed', 'Processed'), ('failed', 'Failed')], db_index=True, default='not_processed', help_text='AI processing status', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='videodownload',
+            name='audio_prompt_status',
+            field=models.CharField(choices=[('not_generated', 'Not Generated'), ('generating', 'Generating'), ('generated', 'Generated'), ('failed', 'Failed')], db_index=True, default='not_generated', help_text='Audio prompt generation status', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='videodownload',
+            name='is_downloaded',
+            field=models.BooleanField(db_index=True, default=False, help_text='Is video saved locally?'),
+        ),
+        migrations.AlterField(
+            model_name='videodownload',
+            name='status',
+            field=models.CharField(choices=[('success', 'Success'), ('failed', 'Failed'), ('pending', 'Pending')], db_index=True, default='pending', help_text='Extraction status', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='videodownload',
+            name='transcription_status',
+            field=models.CharField(choices=[('not_transcribed', 'Not Transcribed'), ('transcribing', 'Transcribing'), ('transcribed', 'Transcribed'), ('failed', 'Failed')], db_index=True, default='not_transcribed', help_text='Transcription status', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='videodownload',
+            index=models.Index(fields=['status', 'created_at'], name='vd_status_created'),
+        ),
+        migrations.AddIndex(
+            model_name='videodownload',
+            index=models.Index(fields=['ai_processing_status', 'created_at'], name='vd_ai_status_created'),
+        ),
+        migrations.AddIndex(
+            model_name='videodownload',
+            index=models.Index(fields=['transcription_status', 'created_at'], name='vd_tr_status_created'),
+        ),
+    ]
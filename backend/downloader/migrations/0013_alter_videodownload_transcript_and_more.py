@@ -0,0 +1,36 @@
+# Generated by Django 4.2.26 on 2026-08-27 14:56
+
+from django.db import migrations
+import downloader.fields
+
+
+def compress_existing_transcripts(apps, schema_editor):
+    """Rewrite rows saved before the columns were compressed.
+
+    Reading falls back to raw text for legacy rows, so this is a space
+    optimization rather than a correctness requirement.
+    """
+    VideoDownload = apps.get_model('downloader', 'VideoDownload')
+    for video in VideoDownload.objects.all().iterator():
+        video.save(update_fields=['transcript', 'transcript_hindi'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('downloader', '0012_alter_videodownload_ai_processing_status_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='videodownload',
+            name='transcript',
+            field=downloader.fields.CompressedTextField(blank=True, editable=True, help_text='Full transcript of video speech/audio'),
+        ),
+        migrations.AlterField(
+            model_name='videodownload',
+            name='transcript_hindi',
+            field=downloader.fields.CompressedTextField(blank=True, editable=True, help_text='Hindi translation of the transcript'),
+        ),
+        migrations.RunPython(compress_existing_transcripts, migrations.RunPython.noop),
+    ]
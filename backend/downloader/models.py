@@ -1,6 +1,9 @@
+from django.core.cache import cache
 from django.db import models
 from django.utils import timezone
 
+from .fields import CompressedTextField
+
 class AIProviderSettings(models.Model):
     """Store AI provider configuration for the application."""
     PROVIDER_CHOICES = [
@@ -11,6 +14,9 @@ class AIProviderSettings(models.Model):
     provider = models.CharField(max_length=20, choices=PROVIDER_CHOICES, default='gemini')
     api_key = models.CharField(max_length=255, blank=True)
 
+    CACHE_KEY = 'downloader:settings:aiprovidersettings'
+    CACHE_TIMEOUT = 60 * 60
+
     class Meta:
         verbose_name = "AI Provider Setting"
         verbose_name_plural = "AI Provider Settings"
@@ -18,10 +24,61 @@ class AIProviderSettings(models.Model):
     def __str__(self):
         return f"{self.provider} settings"
 
+    @classmethod
+    def get_solo(cls):
+        """Return the settings row via the cache.
+
+        The row changes rarely but is read on every AI call, so a cache
+        hit avoids a SELECT per read. The cache is refreshed on save and
+        dropped on delete.
+        """
+        obj = cache.get(cls.CACHE_KEY)
+        if obj is None:
+            obj = cls.objects.first()
+            if obj is not None:
+                cache.set(cls.CACHE_KEY, obj, cls.CACHE_TIMEOUT)
+        return obj
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        cache.set(self.CACHE_KEY, self, self.CACHE_TIMEOUT)
+
+    def delete(self, *args, **kwargs):
+        super().delete(*args, **kwargs)
+        cache.delete(self.CACHE_KEY)
+
+
+class VideoDownloadQuerySet(models.QuerySet):
+    """QuerySet with a hot/cold partition over VideoDownload columns."""
+
+    def hot(self):
+        """Skip the large text columns (transcripts, descriptions, AI output).
+
+        List and dashboard queries only render ids/urls/statuses/timestamps;
+        deferring the cold columns keeps those rows a few hundred bytes
+        instead of many KB of transcript text.
+        """
+        return self.defer(*VideoDownload.COLD_CONTENT_FIELDS)
+
 
 class VideoDownload(models.Model):
     """Model to track video downloads from Xiaohongshu/RedNote"""
-    
+
+    # Large, rarely-listed text columns; everything else is "hot" state
+    # that list views and workers filter on.
+    COLD_CONTENT_FIELDS = (
+        'description',
+        'original_description',
+        'error_message',
+        'ai_summary',
+        'ai_error_message',
+        'transcript',
+        'transcript_hindi',
+        'transcript_error_message',
+        'audio_generation_prompt',
+        'audio_prompt_error',
+    )
+
     STATUS_CHOICES = [
         ('success', 'Success'),
         ('failed', 'Failed'),
@@ -70,7 +127,7 @@ class VideoDownload(models.Model):
     video_url = models.URLField(max_length=1000, blank=True, help_text="Extracted video URL")
     cover_url = models.URLField(max_length=1000, blank=True, help_text="Cover/thumbnail URL")
     local_file = models.FileField(upload_to='videos/', blank=True, null=True, help_text="Locally downloaded video file")
-    is_downloaded = models.BooleanField(default=False, help_text="Is video saved locally?")
+    is_downloaded = models.BooleanField(default=False, db_index=True, help_text="Is video saved locally?")
     
     # Metadata
     extraction_method = models.CharField(
@@ -80,9 +137,10 @@ class VideoDownload(models.Model):
         help_text="Which extraction method succeeded"
     )
     status = models.CharField(
-        max_length=20, 
-        choices=STATUS_CHOICES, 
+        max_length=20,
+        choices=STATUS_CHOICES,
         default='pending',
+        db_index=True,
         help_text="Extraction status"
     )
     error_message = models.TextField(blank=True, help_text="Error message if failed")
@@ -92,6 +150,7 @@ class VideoDownload(models.Model):
         max_length=20,
         choices=AI_PROCESSING_STATUS_CHOICES,
         default='not_processed',
+        db_index=True,
         help_text="AI processing status"
     )
     ai_processed_at = models.DateTimeField(blank=True, null=True, help_text="When AI processing was completed")
@@ -104,10 +163,11 @@ class VideoDownload(models.Model):
         max_length=20,
         choices=TRANSCRIPTION_STATUS_CHOICES,
         default='not_transcribed',
+        db_index=True,
         help_text="Transcription status"
     )
-    transcript = models.TextField(blank=True, help_text="Full transcript of video speech/audio")
-    transcript_hindi = models.TextField(blank=True, help_text="Hindi translation of the transcript")
+    transcript = CompressedTextField(blank=True, help_text="Full transcript of video speech/audio")
+    transcript_hindi = CompressedTextField(blank=True, help_text="Hindi translation of the transcript")
     transcript_language = models.CharField(max_length=10, blank=True, help_text="Detected language of transcript")
     transcript_started_at = models.DateTimeField(blank=True, null=True, help_text="When transcription started")
     transcript_processed_at = models.DateTimeField(blank=True, null=True, help_text="When transcription was completed")
@@ -118,6 +178,7 @@ class VideoDownload(models.Model):
         max_length=20,
         choices=AUDIO_PROMPT_STATUS_CHOICES,
         default='not_generated',
+        db_index=True,
         help_text="Audio prompt generation status"
     )
     audio_generation_prompt = models.TextField(blank=True, help_text="AI-generated prompt for audio generation")
@@ -127,11 +188,20 @@ class VideoDownload(models.Model):
     # Timestamps
     created_at = models.DateTimeField(default=timezone.now, help_text="When the download was requested")
     updated_at = models.DateTimeField(auto_now=True, help_text="Last update time")
-    
+
+    objects = VideoDownloadQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Video Download"
         verbose_name_plural = "Video Downloads"
+        indexes = [
+            # Composite indexes matching the "pending work ordered by age"
+            # queries used by the admin changelist and worker dispatch
+            models.Index(fields=['status', 'created_at'], name='vd_status_created'),
+            models.Index(fields=['ai_processing_status', 'created_at'], name='vd_ai_status_created'),
+            models.Index(fields=['transcription_status', 'created_at'], name='vd_tr_status_created'),
+        ]
     
     def __str__(self):
         return f"{self.title[:50] if self.title else 'Untitled'} - {self.status}"
@@ -34,28 +34,14 @@ def translate_text(text, target='en'):
         return text
 
 def perform_extraction(url):
-    """Perform video extraction using multiple methods"""
-    # Priority 1: Try Seekin.ai API (Works on blocked IPs)
-    print(f"Attempting extraction via Seekin.ai API: {url}")
-    video_data = extract_video_seekin(url)
-    if video_data:
-        video_data['method'] = 'seekin'
-        return video_data
+    """Perform video extraction, trying each method in EXTRACTION_METHODS order"""
+    for method_name, extractor in EXTRACTION_METHODS:
+        print(f"Attempting extraction via {method_name}: {url}")
+        video_data = extractor(url)
+        if video_data:
+            video_data['method'] = method_name
+            return video_data
 
-    # Priority 2: yt-dlp (Works on local/unblocked IPs)
-    print(f"Seekin API failed. Fallback to yt-dlp: {url}")
-    video_data = extract_video_ytdlp(url)
-    if video_data:
-        video_data['method'] = 'yt-dlp'
-        return video_data
-    
-    # Priority 3: Direct requests
-    print(f"yt-dlp failed. Fallback to requests: {url}")
-    video_data = extract_video_requests(url)
-    if video_data:
-        video_data['method'] = 'requests'
-        return video_data
-    
     return None
 
 def extract_video_seekin(url):
@@ -198,6 +184,16 @@ def extract_video_requests(url):
         print(f"Requests extraction error: {e}")
         return None
 
+# Extraction fallback chain, in priority order:
+# Seekin.ai works on blocked IPs, yt-dlp on local/unblocked IPs, and
+# direct requests is the last resort. perform_extraction walks this
+# table instead of a hand-written if/elif cascade.
+EXTRACTION_METHODS = (
+    ('seekin', extract_video_seekin),
+    ('yt-dlp', extract_video_ytdlp),
+    ('requests', extract_video_requests),
+)
+
 def download_file(url):
     """Download file content from URL"""
     try:
@@ -362,6 +358,47 @@ def process_video_with_ai(video_download):
             'error': error_msg
         }
 
+def run_ai_processing(video_download):
+    """
+    Run AI processing for a video and persist the outcome.
+
+    Flips ai_processing_status to 'processing', calls
+    process_video_with_ai, and saves either the summary/tags or the
+    error message. Single entry point shared by the API view and the
+    admin actions so the status bookkeeping lives in one place.
+
+    Returns:
+        dict: the result from process_video_with_ai
+    """
+    from django.utils import timezone
+
+    video_download.ai_processing_status = 'processing'
+    video_download.save(update_fields=['ai_processing_status', 'updated_at'])
+
+    try:
+        result = process_video_with_ai(video_download)
+    except Exception as e:
+        result = {'summary': '', 'tags': [], 'status': 'failed', 'error': str(e)}
+
+    if result['status'] == 'success':
+        video_download.ai_summary = result['summary']
+        video_download.ai_tags = ', '.join(result['tags'])
+        video_download.ai_processing_status = 'processed'
+        video_download.ai_processed_at = timezone.now()
+        video_download.ai_error_message = ''
+        video_download.save(update_fields=[
+            'ai_summary', 'ai_tags', 'ai_processing_status',
+            'ai_processed_at', 'ai_error_message', 'updated_at'
+        ])
+    else:
+        video_download.ai_processing_status = 'failed'
+        video_download.ai_error_message = result.get('error') or 'Unknown error'
+        video_download.save(update_fields=[
+            'ai_processing_status', 'ai_error_message', 'updated_at'
+        ])
+
+    return result
+
 def transcribe_video(video_download):
     """
     Transcribe video using NCA Toolkit API.
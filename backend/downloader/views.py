@@ -1,5 +1,7 @@
 import json
+import logging
 from django.shortcuts import render, redirect
+from django.db import connection, transaction
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
@@ -7,6 +9,8 @@ from django.utils import timezone
 from .models import VideoDownload
 from .utils import perform_extraction, extract_video_id, translate_text
 
+logger = logging.getLogger(__name__)
+
 def index(request):
     """Redirect homepage to admin login"""
     return redirect('/admin/')
@@ -22,7 +26,9 @@ def extract_video(request):
         if not url:
             return JsonResponse({"error": "URL is required"}, status=400)
         
-        # Check for existing video by ID first
+        # Check for existing video by ID first. One fetch covers both the
+        # cached-response and already-exists cases; true create races are
+        # caught by the UNIQUE constraint handler below.
         video_id = extract_video_id(url)
         if video_id:
             existing = VideoDownload.objects.filter(video_id=video_id).first()
@@ -40,13 +46,7 @@ def extract_video(request):
                     return JsonResponse({
                         "error": f"Video with ID '{video_id}' already exists but extraction failed."
                     }, status=400)
-        
-        # Check if video_id already exists before creating (race condition protection)
-        if video_id and VideoDownload.objects.filter(video_id=video_id).exists():
-            return JsonResponse({
-                "error": f"Video with ID '{video_id}' already exists."
-            }, status=400)
-        
+
         # Create a pending download record
         try:
             download = VideoDownload.objects.create(
@@ -120,7 +120,7 @@ def ai_settings(request):
     """GET returns current AI provider settings, POST updates them."""
     if request.method == "GET":
         try:
-            settings = AIProviderSettings.objects.first()
+            settings = AIProviderSettings.get_solo()
             if not settings:
                 return JsonResponse({"provider": "gemini", "api_key": ""})
             return JsonResponse({"provider": settings.provider, "api_key": settings.api_key})
@@ -166,33 +166,22 @@ def list_videos(request):
         if search:
             queryset = queryset.filter(title__icontains=search)
             
-        # Serialize data
-        videos = []
-        for video in queryset:
-            videos.append({
-                "id": video.id,
-                "url": video.url,
-                "title": video.title,
-                "original_title": video.original_title,
-                "description": video.description,
-                "cover_url": video.cover_url,
-                "video_url": video.video_url,
-                "status": video.status,
-                "transcription_status": video.transcription_status,
-                "ai_processing_status": video.ai_processing_status,
-                "audio_prompt_status": video.audio_prompt_status,
-                "transcript_hindi": video.transcript_hindi,
-                "is_downloaded": video.is_downloaded,
-                "extraction_method": video.extraction_method,
-                "created_at": video.created_at.isoformat(),
-            })
-            
+        # Serialize straight from .values() dicts — the listing renders a
+        # fixed field set, so there is no need to hydrate model instances
+        videos = list(queryset.values(
+            'id', 'url', 'title', 'original_title', 'description',
+            'cover_url', 'video_url', 'status', 'transcription_status',
+            'ai_processing_status', 'audio_prompt_status',
+            'transcript_hindi', 'is_downloaded', 'extraction_method',
+            'created_at',
+        ))
+        for video in videos:
+            video['created_at'] = video['created_at'].isoformat()
+
         return JsonResponse(videos, safe=False)
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)
 
-@csrf_exempt
-@require_http_methods(["POST"])
 @csrf_exempt
 @require_http_methods(["POST"])
 def download_video(request, video_id):
@@ -230,14 +219,27 @@ def transcribe_video_view(request, video_id):
     """Start transcription with Hindi translation"""
     try:
         from .utils import transcribe_video, translate_text
-        
-        video = VideoDownload.objects.get(id=video_id)
-        
-        # Update status to transcribing
-        video.transcription_status = 'transcribing'
-        video.transcript_started_at = timezone.now()
-        video.save()
-        
+
+        # Claim the video under a row lock (where the backend supports it)
+        # so two concurrent requests cannot both start transcription and
+        # pay for duplicate transcription jobs
+        with transaction.atomic():
+            queryset = VideoDownload.objects.all()
+            if connection.features.has_select_for_update:
+                queryset = queryset.select_for_update(
+                    skip_locked=connection.features.has_select_for_update_skip_locked
+                )
+            video = queryset.get(id=video_id)
+
+            if video.transcription_status == 'transcribing':
+                return JsonResponse(
+                    {"error": "Transcription is already in progress"}, status=409
+                )
+
+            video.transcription_status = 'transcribing'
+            video.transcript_started_at = timezone.now()
+            video.save(update_fields=['transcription_status', 'transcript_started_at', 'updated_at'])
+
         # Perform transcription
         result = transcribe_video(video)
         
@@ -272,15 +274,12 @@ def transcribe_video_view(request, video_id):
     except VideoDownload.DoesNotExist:
         return JsonResponse({"error": "Video not found"}, status=404)
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"Error in transcribe_video_view: {str(e)}")
-        print(f"Traceback: {error_trace}")
-        
+        logger.exception("Error in transcribe_video_view for video %s", video_id)
+
         if 'video' in locals():
             video.transcription_status = 'failed'
             video.transcript_error_message = str(e)
-            video.save()
+            video.save(update_fields=['transcription_status', 'transcript_error_message', 'updated_at'])
         
         # Return a more user-friendly error message
         error_message = str(e)
@@ -292,39 +291,31 @@ def transcribe_video_view(request, video_id):
 @require_http_methods(["GET"])
 def get_transcription_status(request, video_id):
     """Get transcription status"""
-    try:
-        video = VideoDownload.objects.get(id=video_id)
-        return JsonResponse({
-            "status": video.transcription_status,
-            "transcript": video.transcript,
-            "language": video.transcript_language
-        })
-    except VideoDownload.DoesNotExist:
+    # Polled repeatedly by the frontend — read a dict instead of
+    # hydrating a full model instance each time
+    video = VideoDownload.objects.filter(id=video_id).values(
+        'transcription_status', 'transcript', 'transcript_language'
+    ).first()
+    if video is None:
         return JsonResponse({"error": "Video not found"}, status=404)
+    return JsonResponse({
+        "status": video['transcription_status'],
+        "transcript": video['transcript'],
+        "language": video['transcript_language']
+    })
 
 @csrf_exempt
 @require_http_methods(["POST"])
 def process_ai_view(request, video_id):
     """Start AI processing to generate summary and tags"""
     try:
-        from .utils import process_video_with_ai
-        
+        from .utils import run_ai_processing
+
         video = VideoDownload.objects.get(id=video_id)
-        
-        # Update status to processing
-        video.ai_processing_status = 'processing'
-        video.save()
-        
-        # Perform AI processing
-        result = process_video_with_ai(video)
-        
+
+        result = run_ai_processing(video)
+
         if result['status'] == 'success':
-            video.ai_summary = result['summary']
-            video.ai_tags = ','.join(result['tags'])
-            video.ai_processing_status = 'processed'
-            video.ai_processed_at = timezone.now()
-            video.save()
-            
             return JsonResponse({
                 "status": "success",
                 "message": "AI processing completed",
@@ -332,18 +323,11 @@ def process_ai_view(request, video_id):
                 "tags": video.ai_tags
             })
         else:
-            video.ai_processing_status = 'failed'
-            video.ai_error_message = result.get('error', 'Unknown error')
-            video.save()
             return JsonResponse({"error": result.get('error', 'AI processing failed')}, status=500)
-            
+
     except VideoDownload.DoesNotExist:
         return JsonResponse({"error": "Video not found"}, status=404)
     except Exception as e:
-        if 'video' in locals():
-            video.ai_processing_status = 'failed'
-            video.ai_error_message = str(e)
-            video.save()
         return JsonResponse({"error": str(e)}, status=500)
 
 @csrf_exempt
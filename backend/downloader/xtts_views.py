@@ -1,5 +1,6 @@
 import os
 import json
+import logging
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
@@ -8,6 +9,29 @@ from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
 from .models import SavedVoice
 
+logger = logging.getLogger(__name__)
+
+# XTTS v2 supported languages — static, so built once at import time
+XTTS_LANGUAGES = {
+    "en": "English",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German",
+    "it": "Italian",
+    "pt": "Portuguese",
+    "pl": "Polish",
+    "tr": "Turkish",
+    "ru": "Russian",
+    "nl": "Dutch",
+    "cs": "Czech",
+    "ar": "Arabic",
+    "zh-cn": "Chinese",
+    "ja": "Japanese",
+    "hu": "Hungarian",
+    "ko": "Korean",
+    "hi": "Hindi"
+}
+
 # TTS model - lazy loaded to avoid startup crashes
 tts_model = None
 TTS_AVAILABLE = False
@@ -45,27 +69,7 @@ def get_tts_model():
 @require_http_methods(["GET"])
 def get_languages(request):
     """Get supported languages for XTTS"""
-    # XTTS v2 supported languages
-    languages = {
-        "en": "English",
-        "es": "Spanish",
-        "fr": "French",
-        "de": "German",
-        "it": "Italian",
-        "pt": "Portuguese",
-        "pl": "Polish",
-        "tr": "Turkish",
-        "ru": "Russian",
-        "nl": "Dutch",
-        "cs": "Czech",
-        "ar": "Arabic",
-        "zh-cn": "Chinese",
-        "ja": "Japanese",
-        "hu": "Hungarian",
-        "ko": "Korean",
-        "hi": "Hindi"
-    }
-    return JsonResponse(languages)
+    return JsonResponse(XTTS_LANGUAGES)
 
 @csrf_exempt
 @require_http_methods(["GET", "POST"])
@@ -231,8 +235,5 @@ def generate_speech(request):
         return JsonResponse({"audio_url": request.build_absolute_uri(audio_url)})
         
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"Error generating speech: {str(e)}")
-        print(error_trace)
+        logger.exception("Error generating speech")
         return JsonResponse({"error": f"Speech generation failed: {str(e)}"}, status=500)
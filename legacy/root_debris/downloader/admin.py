@@ -2,7 +2,7 @@ from django.contrib import admin
 from django.contrib.auth.models import User, Group
 from django.utils.html import format_html
 from django.contrib import messages
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from django.shortcuts import render, redirect, get_object_or_404
 from .models import VideoDownload, AIProviderSettings, ClonedVoice, CloudinarySettings, GoogleSheetsSettings, WatermarkSettings
@@ -116,9 +116,13 @@ class ClonedVoiceAdmin(admin.ModelAdmin):
     def save_model(self, request, obj, form, change):
         """Override save to ensure only one default voice exists"""
         if obj.is_default:
-            # Unset all other defaults
-            ClonedVoice.objects.filter(is_default=True).exclude(pk=obj.pk).update(is_default=False)
-        super().save_model(request, obj, form, change)
+            # Swap the default atomically; the uniq_default_voice constraint
+            # guarantees two concurrent saves can't both end up default
+            with transaction.atomic():
+                ClonedVoice.objects.filter(is_default=True).exclude(pk=obj.pk).update(is_default=False)
+                super().save_model(request, obj, form, change)
+        else:
+            super().save_model(request, obj, form, change)
 
 @admin.register(VideoDownload)
 class VideoDownloadAdmin(admin.ModelAdmin):
@@ -3,6 +3,9 @@ REST API Views for RedNote Downloader
 """
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from django.core.cache import cache
+from django.db import close_old_connections
 from django.utils import timezone
 from django.db.models import Count, Q
 from rest_framework import viewsets, status
@@ -13,18 +16,29 @@ from rest_framework.permissions import AllowAny
 
 logger = logging.getLogger(__name__)
 
-from .models import VideoDownload, AIProviderSettings, CloudinarySettings, GoogleSheetsSettings, WatermarkSettings
+# Bounded pool for background reprocess pipelines. A fresh thread per
+# request meant a burst of reprocesses spawned unbounded threads; the
+# pool caps concurrency and reuses workers.
+_PIPELINE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='pipeline')
+
+# Dashboard stats are polled far more often than the table changes; a
+# short TTL bounds staleness to a few seconds
+DASHBOARD_STATS_CACHE_KEY = 'downloader:dashboard_stats'
+DASHBOARD_STATS_CACHE_TTL = 15
+
+from .models import VideoDownload, AIProviderSettings, CloudinarySettings, GoogleSheetsSettings, WatermarkSettings, hash_file_content
 from .serializers import (
     VideoDownloadSerializer, VideoDownloadListSerializer,
     AIProviderSettingsSerializer, VideoExtractSerializer,
-    VideoTranscribeSerializer, BulkActionSerializer, DashboardStatsSerializer,
-    CloudinarySettingsSerializer, GoogleSheetsSettingsSerializer, WatermarkSettingsSerializer
+    VideoTranscribeSerializer, BulkActionSerializer,
+    CloudinarySettingsSerializer, GoogleSheetsSettingsSerializer, WatermarkSettingsSerializer,
+    serialize_video_list_fast, parse_field_pruning_params,
 )
 from .utils import (
     perform_extraction, extract_video_id, detect_video_source, translate_text,
     transcribe_video, download_file,
     process_video_with_ai, get_video_duration,
-    calculate_tts_parameters, generate_hindi_script, generate_video_metadata
+    generate_hindi_script, generate_video_metadata
 )
 # Optional imports - these services may not be installed
 try:
@@ -50,7 +64,34 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Get queryset"""
-        return VideoDownload.objects.all().order_by('-created_at')
+        queryset = VideoDownload.objects.all().order_by('-created_at')
+        if self.action == 'retrieve':
+            queryset = self._defer_pruned_heavy_fields(queryset)
+        return queryset
+
+    def _defer_pruned_heavy_fields(self, queryset):
+        """Skip loading transcript columns the response will prune.
+
+        Pairs with the serializer's ?fields=/?omit= support: a
+        metadata-only detail call neither reads the multi-KB TextFields
+        from the database nor serializes them.
+        """
+        keep, omitted = parse_field_pruning_params(self.request.query_params)
+        if keep is None and not omitted:
+            return queryset
+        deferred = [
+            name for name in VideoDownloadSerializer.HEAVY_TEXT_FIELDS
+            if name in omitted or (keep is not None and name not in keep)
+        ]
+        # hindi_script backs the clean_script_for_tts getter, so it must
+        # stay loaded while that field is still rendered
+        renders_clean_script = (
+            'clean_script_for_tts' not in omitted
+            and (keep is None or 'clean_script_for_tts' in keep)
+        )
+        if renders_clean_script and 'hindi_script' in deferred:
+            deferred.remove('hindi_script')
+        return queryset.defer(*deferred) if deferred else queryset
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -65,7 +106,10 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
 
     def list(self, request):
         """List all videos with optional filtering"""
-        queryset = self.get_queryset()
+        # Only fetch the columns the list serializer renders
+        queryset = VideoDownloadListSerializer.setup_eager_loading(
+            VideoDownload.objects.all()
+        ).order_by('-created_at')
 
         # Filter by status
         status_filter = request.query_params.get('status')
@@ -82,8 +126,8 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
         if ai_status:
             queryset = queryset.filter(ai_processing_status=ai_status)
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        # Fast path: plain dicts instead of per-field DRF binding
+        return Response(serialize_video_list_fast(queryset, request))
 
     @action(detail=False, methods=['post'])
     def extract(self, request):
@@ -248,15 +292,7 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
                         except Exception as e:
                             print(f"Could not extract duration from video URL: {e}")
                 
-                # Calculate TTS parameters if duration is available
-                if download.duration:
-                    from .utils import calculate_tts_parameters
-                    tts_params = calculate_tts_parameters(download.duration)
-                    download.tts_speed = tts_params['speed']
-                    download.tts_temperature = tts_params['temperature']
-                    download.tts_repetition_penalty = tts_params['repetition_penalty']
-                    print(f"TTS parameters calculated: speed={tts_params['speed']}, temp={tts_params['temperature']}")
-                
+                # TTS parameters are derived from duration on read, nothing to store
                 download.save()
 
                 return Response({
@@ -315,12 +351,7 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
                     duration = get_video_duration(download.local_file.path)
                     if duration:
                         download.duration = duration
-                        # Calculate TTS parameters
-                        tts_params = calculate_tts_parameters(duration)
-                        download.tts_speed = tts_params['speed']
-                        download.tts_temperature = tts_params['temperature']
-                        download.tts_repetition_penalty = tts_params['repetition_penalty']
-                        download.save()
+                        download.save(update_fields=['duration', 'updated_at'])
             except Exception as e:
                 print(f"Error getting video duration: {e}")
             
@@ -439,10 +470,24 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
                 if not is_video:
                     print(f"WARNING: File does not have standard video signatures, but size is reasonable ({file_content.size} bytes). Will attempt to save - ffmpeg will handle format detection.")
                 
-                filename = f"{video.video_id or video.id}.mp4"
-                video.local_file.save(filename, file_content)
+                # Content-address the download so re-processing the same
+                # source reuses the existing blob instead of writing a copy
+                video.source_sha256 = hash_file_content(file_content)
+                duplicate = (
+                    VideoDownload.objects
+                    .filter(source_sha256=video.source_sha256)
+                    .exclude(pk=video.pk)
+                    .exclude(local_file='')
+                    .first()
+                )
+                if duplicate and duplicate.local_file:
+                    print(f"Duplicate content detected (sha256={video.source_sha256[:12]}…), reusing file from video {duplicate.id}")
+                    video.local_file = duplicate.local_file.name
+                else:
+                    filename = f"{video.video_id or video.id}.mp4"
+                    video.local_file.save(filename, file_content)
                 video.is_downloaded = True
-                
+
                 # Ensure file is saved and flushed before reading
                 video.save()
                 
@@ -485,14 +530,7 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
                 # ALWAYS save duration if found (even if it already exists, update it)
                 if duration:
                     video.duration = float(duration)
-                    
-                    # Calculate TTS parameters based on duration
-                    tts_params = calculate_tts_parameters(duration)
-                    video.tts_speed = tts_params['speed']
-                    video.tts_temperature = tts_params['temperature']
-                    video.tts_repetition_penalty = tts_params['repetition_penalty']
                     print(f"✓ Duration saved: {duration} seconds ({int(duration // 60)}:{int(duration % 60):02d})")
-                    print(f"TTS parameters calculated: speed={tts_params['speed']}, temp={tts_params['temperature']}")
                 else:
                     print("WARNING: Could not extract video duration - duration will not be saved")
                 
@@ -544,8 +582,8 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
         # Step 1: Transcription
         video.transcription_status = 'transcribing'
         video.transcript_started_at = timezone.now()
-        video.save()
-        
+        video.save(update_fields=['transcription_status', 'transcript_started_at', 'updated_at'])
+
         print(f"🔄 Starting transcription for video {video.id} (title: {video.title[:50]}...)")
         transcription_start_time = timezone.now()
         
@@ -582,8 +620,8 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
                 print(f"⚠️  {error_msg}")
                 video.transcription_status = 'failed'
                 video.transcript_error_message = error_msg
-                video.save()
-                
+                video.save(update_fields=['transcription_status', 'transcript_error_message', 'updated_at'])
+
                 return Response({
                     "status": "failed",
                     "error": error_msg,
@@ -599,8 +637,8 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
                 print(f"⚠️  {error_msg}")
                 video.transcription_status = 'failed'
                 video.transcript_error_message = error_msg
-                video.save()
-                
+                video.save(update_fields=['transcription_status', 'transcript_error_message', 'updated_at'])
+
                 return Response({
                     "status": "failed",
                     "error": error_msg,
@@ -858,7 +896,7 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
                             try:
                                 # Get Gemini API key from AIProviderSettings
                                 from .models import AIProviderSettings
-                                settings_obj = AIProviderSettings.objects.first()
+                                settings_obj = AIProviderSettings.get_solo()
                                 if not settings_obj or not settings_obj.api_key:
                                     raise Exception("Gemini API key not configured. Please set it in AI Provider Settings.")
                                 
@@ -1070,7 +1108,7 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
                                                     from .models import WatermarkSettings
                                                     from .watermark_service import apply_moving_watermark
                                                     
-                                                    watermark_settings = WatermarkSettings.objects.first()
+                                                    watermark_settings = WatermarkSettings.get_solo()
                                                     if watermark_settings and watermark_settings.enabled and watermark_settings.watermark_text:
                                                         # Create temp file for watermarked video
                                                         temp_watermarked = tempfile.NamedTemporaryFile(delete=False, suffix='.mp4')
@@ -1104,6 +1142,7 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
                                                 
                                                 # Save final video (with or without watermark)
                                                 with open(temp_final_path, 'rb') as f:
+                                                    video.final_sha256 = hash_file_content(f)
                                                     video.final_processed_video.save(f"final_{video.pk}.mp4", File(f), save=False)
                                                 final_video_url = request.build_absolute_uri(video.final_processed_video.url)
                                                 video.final_processed_video_url = final_video_url
@@ -1319,18 +1358,26 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'])
     def transcription_status(self, request, pk=None):
         """Get transcription status for a video"""
-        video = self.get_object()
-
+        # Polled by the frontend — read plain dicts instead of hydrating
+        # a full VideoDownload instance on every poll
+        video = VideoDownload.objects.filter(pk=pk).values(
+            'transcription_status', 'transcript', 'transcript_hindi',
+            'transcript_language', 'transcript_error_message', 'transcript_started_at',
+        ).first()
+        if video is None:
+            return Response({"error": "Video not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        tr_status = video['transcription_status']
         response_data = {
-            "status": video.transcription_status,
-            "transcript": video.transcript if video.transcription_status == 'transcribed' else None,
-            "transcript_hindi": video.transcript_hindi if video.transcription_status == 'transcribed' else None,
-            "language": video.transcript_language if video.transcription_status == 'transcribed' else None,
-            "error": video.transcript_error_message if video.transcription_status == 'failed' else None,
+            "status": tr_status,
+            "transcript": video['transcript'] if tr_status == 'transcribed' else None,
+            "transcript_hindi": video['transcript_hindi'] if tr_status == 'transcribed' else None,
+            "language": video['transcript_language'] if tr_status == 'transcribed' else None,
+            "error": video['transcript_error_message'] if tr_status == 'failed' else None,
         }
 
-        if video.transcription_status == 'transcribing' and video.transcript_started_at:
-            elapsed = (timezone.now() - video.transcript_started_at).total_seconds()
+        if tr_status == 'transcribing' and video['transcript_started_at']:
+            elapsed = (timezone.now() - video['transcript_started_at']).total_seconds()
             response_data['elapsed_seconds'] = int(elapsed)
 
         return Response(response_data)
@@ -1418,7 +1465,7 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
             
             # Get Gemini API key from AIProviderSettings
             from .models import AIProviderSettings
-            settings_obj = AIProviderSettings.objects.first()
+            settings_obj = AIProviderSettings.get_solo()
             if not settings_obj or not settings_obj.api_key:
                 error_msg = "Gemini API key not configured. Please set it in AI Provider Settings."
                 video.synthesis_status = 'failed'
@@ -1654,102 +1701,88 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['post'])
     def upload_and_sync(self, request, pk=None):
-        """Manually trigger Cloudinary upload and Google Sheets sync for an existing video"""
-        try:
-            video = self.get_object()
-            
-            if not video.final_processed_video and not video.final_processed_video_url:
-                return Response({
-                    "error": "Video has no final processed video. Please process the video first."
-                }, status=status.HTTP_400_BAD_REQUEST)
-            
-            results = {
-                'metadata_generated': False,
-                'cloudinary_uploaded': False,
-                'google_sheets_synced': False,
-                'errors': []
-            }
-            
-            # Generate metadata if not already generated
-            if not video.generated_title or not video.generated_description:
-                try:
-                    metadata_result = generate_video_metadata(video)
-                    if metadata_result.get('status') == 'success':
-                        video.generated_title = metadata_result.get('title', '')
-                        video.generated_description = metadata_result.get('description', '')
-                        video.generated_tags = metadata_result.get('tags', '')
-                        results['metadata_generated'] = True
-                        print(f"✓ Generated metadata: {video.generated_title[:50]}...")
-                    else:
-                        results['errors'].append(f"Metadata generation failed: {metadata_result.get('error', 'Unknown error')}")
-                except Exception as e:
-                    results['errors'].append(f"Metadata generation error: {str(e)}")
-            
-            # Upload to Cloudinary if enabled (always upload/replace to ensure latest version)
+        """Queue Cloudinary upload and Google Sheets sync for an existing video.
+
+        The upload can take minutes for large files, so the work runs on
+        the shared pipeline pool and the request returns 202 immediately;
+        clients poll cloudinary_url / cloudinary_uploaded_at /
+        google_sheets_synced on the detail endpoint for completion.
+        """
+        video = self.get_object()
+
+        if not video.final_processed_video and not video.final_processed_video_url:
+            return Response({
+                "error": "Video has no final processed video. Please process the video first."
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        video_pk = video.pk
+
+        def run_upload_and_sync():
+            close_old_connections()
             try:
-                if upload_video_file:
-                    # Use video_id as public_id to replace existing video
-                    video_id_for_cloudinary = video.video_id or str(video.id)
-                    cloudinary_result = upload_video_file(
-                        video.final_processed_video,
-                        video_id=video_id_for_cloudinary
-                    )
-                    if cloudinary_result:
-                        video.cloudinary_url = cloudinary_result.get('secure_url') or cloudinary_result.get('url', '')
-                        video.cloudinary_uploaded_at = timezone.now()
-                        results['cloudinary_uploaded'] = True
-                        print(f"✓ Uploaded to Cloudinary (replaced if exists): {video.cloudinary_url[:50]}...")
+                video = VideoDownload.objects.get(pk=video_pk)
+
+                # Generate metadata if not already generated
+                if not video.generated_title or not video.generated_description:
+                    try:
+                        metadata_result = generate_video_metadata(video)
+                        if metadata_result.get('status') == 'success':
+                            video.generated_title = metadata_result.get('title', '')
+                            video.generated_description = metadata_result.get('description', '')
+                            video.generated_tags = metadata_result.get('tags', '')
+                            logger.info(f"Generated metadata for video {video_pk}")
+                        else:
+                            logger.warning(f"Metadata generation failed for video {video_pk}: {metadata_result.get('error', 'Unknown error')}")
+                    except Exception:
+                        logger.exception(f"Metadata generation error for video {video_pk}")
+
+                # Upload to Cloudinary if enabled (always upload/replace to ensure latest version)
+                try:
+                    if upload_video_file:
+                        # Use video_id as public_id to replace existing video
+                        video_id_for_cloudinary = video.video_id or str(video.id)
+                        cloudinary_result = upload_video_file(
+                            video.final_processed_video,
+                            video_id=video_id_for_cloudinary
+                        )
+                        if cloudinary_result:
+                            video.cloudinary_url = cloudinary_result.get('secure_url') or cloudinary_result.get('url', '')
+                            video.cloudinary_uploaded_at = timezone.now()
+                            logger.info(f"Uploaded video {video_pk} to Cloudinary: {video.cloudinary_url[:50]}...")
+                        else:
+                            logger.warning(f"Cloudinary upload failed for video {video_pk} (no result returned)")
                     else:
-                        results['errors'].append("Cloudinary upload failed (no result returned)")
-                else:
-                    results['errors'].append("Cloudinary upload skipped (cloudinary package not installed)")
-            except Exception as e:
-                results['errors'].append(f"Cloudinary upload error: {str(e)}")
-            
-            # Save video with any updates
-            video.save()
-            
-            # Add/Update to Google Sheets if enabled (always sync to ensure latest data)
-            try:
-                if add_video_to_sheet:
-                    sheet_result = add_video_to_sheet(video, video.cloudinary_url)
-                    if sheet_result and sheet_result.get('success'):
-                        results['google_sheets_synced'] = True
-                        print(f"✓ Added/Updated to Google Sheets")
+                        logger.warning("Cloudinary upload skipped (cloudinary package not installed)")
+                except Exception:
+                    logger.exception(f"Cloudinary upload error for video {video_pk}")
+
+                # Save video with any updates
+                video.save()
+
+                # Add/Update to Google Sheets if enabled (always sync to ensure latest data)
+                try:
+                    if add_video_to_sheet:
+                        sheet_result = add_video_to_sheet(video, video.cloudinary_url)
+                        if sheet_result and sheet_result.get('success'):
+                            logger.info(f"Synced video {video_pk} to Google Sheets")
+                        else:
+                            error_msg = sheet_result.get('error', 'Unknown error') if sheet_result else 'Google Sheets not configured'
+                            logger.warning(f"Google Sheets sync failed for video {video_pk}: {error_msg}")
                     else:
-                        error_msg = sheet_result.get('error', 'Unknown error') if sheet_result else 'Google Sheets not configured'
-                        results['errors'].append(f"Google Sheets sync failed: {error_msg}")
-                        logger.warning(f"Google Sheets sync failed for video {video.id}: {error_msg}")
-                else:
-                    error_msg = 'Google Sheets not configured'
-                    results['errors'].append(f"Google Sheets sync failed: {error_msg}")
-            except Exception as e:
-                results['errors'].append(f"Google Sheets sync error: {str(e)}")
-            
-            # Determine overall status
-            success_count = sum([
-                results['metadata_generated'],
-                results['cloudinary_uploaded'],
-                results['google_sheets_synced']
-            ])
-            
-            if success_count > 0:
-                return Response({
-                    "status": "success",
-                    "message": f"Completed {success_count} operation(s)",
-                    **results
-                })
-            else:
-                return Response({
-                    "status": "partial",
-                    "message": "No new operations completed",
-                    **results
-                }, status=status.HTTP_200_OK)
-                
-        except Exception as e:
-            return Response({
-                "error": str(e)
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+                        logger.warning(f"Google Sheets sync failed for video {video_pk}: Google Sheets not configured")
+                except Exception:
+                    logger.exception(f"Google Sheets sync error for video {video_pk}")
+            except Exception:
+                logger.exception(f"upload_and_sync failed for video {video_pk}")
+            finally:
+                close_old_connections()
+
+        _PIPELINE_POOL.submit(run_upload_and_sync)
+
+        return Response({
+            "status": "queued",
+            "message": "Upload and sync started in background"
+        }, status=status.HTTP_202_ACCEPTED)
 
     @action(detail=True, methods=['post'])
     def reprocess(self, request, pk=None):
@@ -1981,11 +2014,12 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
             
             video.save()
             
-            # Trigger the full transcription pipeline in a background thread
+            # Trigger the full transcription pipeline in the background
             # This ensures the request doesn't timeout while processing
-            import threading
-            
             def run_pipeline():
+                # Pool workers are long-lived — drop stale DB connections
+                # before and after each task
+                close_old_connections()
                 try:
                     print(f"🔄 Starting reprocess pipeline for video {video.id} in background thread")
                     
@@ -2168,7 +2202,7 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
                                     try:
                                         # Get Gemini API key from AIProviderSettings
                                         from .models import AIProviderSettings
-                                        settings_obj = AIProviderSettings.objects.first()
+                                        settings_obj = AIProviderSettings.get_solo()
                                         if not settings_obj or not settings_obj.api_key:
                                             raise Exception("Gemini API key not configured. Please set it in AI Provider Settings.")
                                         
@@ -2322,6 +2356,7 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
                                                         # Save final video
                                                         from django.core.files import File
                                                         with open(temp_final_path, 'rb') as f:
+                                                            video.final_sha256 = hash_file_content(f)
                                                             video.final_processed_video.save(f"final_{video.pk}.mp4", File(f), save=False)
                                                         
                                                         final_video_url = request.build_absolute_uri(video.final_processed_video.url)
@@ -2425,10 +2460,11 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
                         video.synthesis_status = 'failed'
                         video.synthesis_error = error_details
                     video.save()
-            
-            # Start the pipeline in a background thread
-            pipeline_thread = threading.Thread(target=run_pipeline, daemon=True)
-            pipeline_thread.start()
+                finally:
+                    close_old_connections()
+
+            # Submit the pipeline to the bounded background pool
+            _PIPELINE_POOL.submit(run_pipeline)
             
             return Response({
                 "status": "processing_started",
@@ -2490,15 +2526,9 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
             # Delete from Cloudinary if public_id exists
             if upload_video_file and video.video_id:
                 try:
-                    from .cloudinary_service import get_cloudinary_config
+                    from .cloudinary_service import configure_cloudinary
                     import cloudinary.uploader
-                    config = get_cloudinary_config()
-                    if config:
-                        cloudinary.config(
-                            cloud_name=config['cloud_name'],
-                            api_key=config['api_key'],
-                            api_secret=config['api_secret']
-                        )
+                    if configure_cloudinary():
                         public_id = f"videos/final/{video.video_id}"
                         cloudinary.uploader.destroy(public_id, resource_type='video')
                         logger.info(f"Deleted video from Cloudinary: {public_id}")
@@ -2570,17 +2600,42 @@ class VideoDownloadViewSet(viewsets.ModelViewSet):
 
 
 
+# Serialized settings payloads keyed on (model, pk); settings rows bump
+# their version on save, so a stale entry is detected by comparison
+_SETTINGS_RESPONSE_CACHE = {}
+
+
+def cached_settings_response(request, serializer_class, instance):
+    """Serialize a settings row once per version, with ETag support.
+
+    Settings change a few times a day but are fetched on every page
+    load. The serialized dict is memoized against the row's version
+    counter, and clients presenting a matching weak ETag get an empty
+    304 instead of a body.
+    """
+    etag = f'W/"{instance.version}"'
+    if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+    key = (type(instance).__name__, instance.pk)
+    cached = _SETTINGS_RESPONSE_CACHE.get(key)
+    if cached is None or cached[0] != instance.version:
+        data = serializer_class(instance, context={'request': request}).data
+        _SETTINGS_RESPONSE_CACHE[key] = (instance.version, data)
+    else:
+        data = cached[1]
+    return Response(data, headers={'ETag': etag})
+
+
 class AISettingsViewSet(viewsets.ViewSet):
     """ViewSet for AI Provider Settings"""
 
     def list(self, request):
         """Get current AI settings"""
-        settings = AIProviderSettings.objects.first()
+        settings = AIProviderSettings.get_solo()
         if not settings:
             return Response({"provider": "gemini", "api_key": ""})
 
-        serializer = AIProviderSettingsSerializer(settings)
-        return Response(serializer.data)
+        return cached_settings_response(request, AIProviderSettingsSerializer, settings)
 
     def create(self, request):
         """Update AI settings"""
@@ -2605,7 +2660,7 @@ class CloudinarySettingsViewSet(viewsets.ViewSet):
 
     def list(self, request):
         """Get current Cloudinary settings"""
-        settings = CloudinarySettings.objects.first()
+        settings = CloudinarySettings.get_solo()
         if not settings:
             return Response({
                 "cloud_name": "",
@@ -2614,8 +2669,7 @@ class CloudinarySettingsViewSet(viewsets.ViewSet):
                 "enabled": False
             })
 
-        serializer = CloudinarySettingsSerializer(settings)
-        return Response(serializer.data)
+        return cached_settings_response(request, CloudinarySettingsSerializer, settings)
 
     def create(self, request):
         """Update Cloudinary settings"""
@@ -2649,7 +2703,7 @@ class GoogleSheetsSettingsViewSet(viewsets.ViewSet):
 
     def list(self, request):
         """Get current Google Sheets settings"""
-        settings = GoogleSheetsSettings.objects.first()
+        settings = GoogleSheetsSettings.get_solo()
         if not settings:
             return Response({
                 "spreadsheet_id": "",
@@ -2658,8 +2712,7 @@ class GoogleSheetsSettingsViewSet(viewsets.ViewSet):
                 "enabled": False
             })
 
-        serializer = GoogleSheetsSettingsSerializer(settings)
-        return Response(serializer.data)
+        return cached_settings_response(request, GoogleSheetsSettingsSerializer, settings)
 
     def create(self, request):
         """Update Google Sheets settings"""
@@ -2693,7 +2746,7 @@ class WatermarkSettingsViewSet(viewsets.ViewSet):
 
     def list(self, request):
         """Get current watermark settings"""
-        settings = WatermarkSettings.objects.first()
+        settings = WatermarkSettings.get_solo()
         if not settings:
             return Response({
                 "enabled": False,
@@ -2704,8 +2757,7 @@ class WatermarkSettingsViewSet(viewsets.ViewSet):
                 "position_change_interval": 1.0
             })
 
-        serializer = WatermarkSettingsSerializer(settings, context={'request': request})
-        return Response(serializer.data)
+        return cached_settings_response(request, WatermarkSettingsSerializer, settings)
 
     def create(self, request):
         """Update watermark settings"""
@@ -2758,7 +2810,7 @@ def test_google_sheets(request):
     }
     
     try:
-        sheets_settings = GoogleSheetsSettings.objects.first()
+        sheets_settings = GoogleSheetsSettings.get_solo()
         
         if not sheets_settings:
             results['errors'].append("Google Sheets settings not found. Please configure in Settings.")
@@ -2884,19 +2936,26 @@ def test_google_sheets(request):
 @api_view(['GET'])
 def dashboard_stats(request):
     """Get dashboard statistics"""
-    stats = {
-        'total_videos': VideoDownload.objects.count(),
-        'successful_extractions': VideoDownload.objects.filter(status='success').count(),
-        'downloaded_locally': VideoDownload.objects.filter(is_downloaded=True).count(),
-        'transcribed': VideoDownload.objects.filter(transcription_status='transcribed').count(),
-        'ai_processed': VideoDownload.objects.filter(ai_processing_status='processed').count(),
-        'audio_prompts_generated': 0,  # Field removed from model, keeping for frontend compatibility
-        'synthesized': VideoDownload.objects.filter(synthesis_status='synthesized').count(),
-        'failed': VideoDownload.objects.filter(status='failed').count(),
-    }
+    # Polled by the dashboard — serve a short-lived cached summary and
+    # recompute with one aggregate pass instead of eight COUNT queries
+    stats = cache.get(DASHBOARD_STATS_CACHE_KEY)
+    if stats is None:
+        stats = VideoDownload.objects.aggregate(
+            total_videos=Count('pk'),
+            successful_extractions=Count('pk', filter=Q(status='success')),
+            downloaded_locally=Count('pk', filter=Q(is_downloaded=True)),
+            transcribed=Count('pk', filter=Q(transcription_status='transcribed')),
+            ai_processed=Count('pk', filter=Q(ai_processing_status='processed')),
+            synthesized=Count('pk', filter=Q(synthesis_status='synthesized')),
+            failed=Count('pk', filter=Q(status='failed')),
+        )
+        # Field removed from model, keeping for frontend compatibility
+        stats['audio_prompts_generated'] = 0
+        cache.set(DASHBOARD_STATS_CACHE_KEY, stats, DASHBOARD_STATS_CACHE_TTL)
 
-    serializer = DashboardStatsSerializer(stats)
-    return Response(serializer.data)
+    # Plain dict response: the stats are already ints straight from the
+    # aggregate, so DRF field binding adds nothing here
+    return Response(stats)
 
 
 @api_view(['POST'])
@@ -2929,8 +2988,19 @@ def bulk_download(request):
         try:
             file_content = download_file(video.video_url)
             if file_content:
-                filename = f"{video.video_id or video.id}.mp4"
-                video.local_file.save(filename, file_content)
+                video.source_sha256 = hash_file_content(file_content)
+                duplicate = (
+                    VideoDownload.objects
+                    .filter(source_sha256=video.source_sha256)
+                    .exclude(pk=video.pk)
+                    .exclude(local_file='')
+                    .first()
+                )
+                if duplicate and duplicate.local_file:
+                    video.local_file = duplicate.local_file.name
+                else:
+                    filename = f"{video.video_id or video.id}.mp4"
+                    video.local_file.save(filename, file_content)
                 video.is_downloaded = True
                 video.save()
                 results.append({
@@ -2974,7 +3044,7 @@ def bulk_transcribe(request):
 
         video.transcription_status = 'transcribing'
         video.transcript_started_at = timezone.now()
-        video.save()
+        video.save(update_fields=['transcription_status', 'transcript_started_at', 'updated_at'])
 
         try:
             result = transcribe_video(video)
@@ -2985,7 +3055,10 @@ def bulk_transcribe(request):
                 video.transcript_hindi = result.get('text_hindi', '')
                 video.transcript_language = result.get('language', '')
                 video.transcript_processed_at = timezone.now()
-                video.save()
+                video.save(update_fields=[
+                    'transcription_status', 'transcript', 'transcript_hindi',
+                    'transcript_language', 'transcript_processed_at', 'updated_at',
+                ])
                 results.append({
                     "id": video.id,
                     "status": "success"
@@ -2993,7 +3066,7 @@ def bulk_transcribe(request):
             else:
                 video.transcription_status = 'failed'
                 video.transcript_error_message = result.get('error', '')
-                video.save()
+                video.save(update_fields=['transcription_status', 'transcript_error_message', 'updated_at'])
                 results.append({
                     "id": video.id,
                     "status": "failed",
@@ -3002,7 +3075,7 @@ def bulk_transcribe(request):
         except Exception as e:
             video.transcription_status = 'failed'
             video.transcript_error_message = str(e)
-            video.save()
+            video.save(update_fields=['transcription_status', 'transcript_error_message', 'updated_at'])
             results.append({
                 "id": video.id,
                 "status": "failed",
@@ -3032,7 +3105,7 @@ def bulk_process_ai(request):
             continue
 
         video.ai_processing_status = 'processing'
-        video.save()
+        video.save(update_fields=['ai_processing_status', 'updated_at'])
 
         try:
             result = process_video_with_ai(video)
@@ -3042,7 +3115,10 @@ def bulk_process_ai(request):
                 video.ai_summary = result.get('summary', '')
                 video.ai_tags = result.get('tags', '')
                 video.ai_processed_at = timezone.now()
-                video.save()
+                video.save(update_fields=[
+                    'ai_processing_status', 'ai_summary', 'ai_tags',
+                    'ai_processed_at', 'updated_at',
+                ])
                 results.append({
                     "id": video.id,
                     "status": "success"
@@ -3050,7 +3126,7 @@ def bulk_process_ai(request):
             else:
                 video.ai_processing_status = 'failed'
                 video.ai_error_message = result.get('error', '')
-                video.save()
+                video.save(update_fields=['ai_processing_status', 'ai_error_message', 'updated_at'])
                 results.append({
                     "id": video.id,
                     "status": "failed",
@@ -3059,7 +3135,7 @@ def bulk_process_ai(request):
         except Exception as e:
             video.ai_processing_status = 'failed'
             video.ai_error_message = str(e)
-            video.save()
+            video.save(update_fields=['ai_processing_status', 'ai_error_message', 'updated_at'])
             results.append({
                 "id": video.id,
                 "status": "failed",
@@ -3118,15 +3194,9 @@ def bulk_delete(request):
             # Delete from Cloudinary if exists
             if upload_video_file and video.video_id:
                 try:
-                    from .cloudinary_service import get_cloudinary_config
+                    from .cloudinary_service import configure_cloudinary
                     import cloudinary.uploader
-                    config = get_cloudinary_config()
-                    if config:
-                        cloudinary.config(
-                            cloud_name=config['cloud_name'],
-                            api_key=config['api_key'],
-                            api_secret=config['api_secret']
-                        )
+                    if configure_cloudinary():
                         public_id = f"videos/final/{video.video_id}"
                         cloudinary.uploader.destroy(public_id, resource_type='video')
                         files_deleted.append('cloudinary_video')
@@ -10,16 +10,23 @@ except ImportError:
     CLOUDINARY_AVAILABLE = False
     cloudinary = None
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from django.conf import settings
 from .models import CloudinarySettings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Above this size, uploads go through upload_large's chunked transfer
+LARGE_UPLOAD_THRESHOLD = 100 * 1024 * 1024
+LARGE_UPLOAD_CHUNK_SIZE = 20 * 1024 * 1024
+
 
 def get_cloudinary_config():
     """Get Cloudinary configuration from settings model"""
-    cloudinary_settings = CloudinarySettings.objects.first()
+    cloudinary_settings = CloudinarySettings.get_solo()
     if not cloudinary_settings or not cloudinary_settings.enabled:
         return None
     
@@ -34,12 +41,37 @@ def get_cloudinary_config():
     }
 
 
-def upload_video_to_cloudinary(video_file_path, public_id=None, resource_type='video'):
+# Credentials last applied via cloudinary.config(); repeated uploads in
+# one process skip the redundant SDK reconfiguration
+_configured_fingerprint = None
+
+
+def configure_cloudinary():
+    """Fetch the Cloudinary config and apply it to the SDK if needed.
+
+    Returns the config dict when Cloudinary is usable, None otherwise.
+    The settings row comes from the cached get_solo() accessor and
+    cloudinary.config() only runs when the credentials change, so a
+    bulk upload pays one DB/cache read and one SDK configuration
+    instead of one of each per file.
+    """
+    global _configured_fingerprint
+    config = get_cloudinary_config()
+    if not config:
+        return None
+    fingerprint = (config['cloud_name'], config['api_key'], config['api_secret'])
+    if fingerprint != _configured_fingerprint:
+        cloudinary.config(**config)
+        _configured_fingerprint = fingerprint
+    return config
+
+
+def upload_video_to_cloudinary(video_source, public_id=None, resource_type='video'):
     """
     Upload a video file to Cloudinary
-    
+
     Args:
-        video_file_path: Path to the video file
+        video_source: Path to the video file, or a file-like object
         public_id: Optional public ID for the resource
         resource_type: Resource type ('video' or 'image')
     
@@ -50,19 +82,11 @@ def upload_video_to_cloudinary(video_file_path, public_id=None, resource_type='v
         logger.warning("Cloudinary package not installed. Install with: pip install cloudinary")
         return None
     
-    config = get_cloudinary_config()
-    if not config:
+    if not configure_cloudinary():
         logger.warning("Cloudinary not configured or disabled")
         return None
-    
+
     try:
-        # Configure Cloudinary
-        cloudinary.config(
-            cloud_name=config['cloud_name'],
-            api_key=config['api_key'],
-            api_secret=config['api_secret']
-        )
-        
         # Upload options
         upload_options = {
             'resource_type': resource_type,
@@ -74,11 +98,24 @@ def upload_video_to_cloudinary(video_file_path, public_id=None, resource_type='v
         if public_id:
             upload_options['public_id'] = public_id
         
-        # Upload the file (will replace existing if public_id matches)
-        result = cloudinary.uploader.upload(
-            video_file_path,
-            **upload_options
-        )
+        # Upload the file (will replace existing if public_id matches).
+        # Big files stream through upload_large one chunk at a time
+        # instead of buffering the whole body in memory.
+        if isinstance(video_source, str):
+            size = os.path.getsize(video_source)
+        else:
+            size = getattr(video_source, 'size', None)
+        if size and size > LARGE_UPLOAD_THRESHOLD:
+            result = cloudinary.uploader.upload_large(
+                video_source,
+                chunk_size=LARGE_UPLOAD_CHUNK_SIZE,
+                **upload_options
+            )
+        else:
+            result = cloudinary.uploader.upload(
+                video_source,
+                **upload_options
+            )
         
         logger.info(f"Successfully uploaded video to Cloudinary: {result.get('url')}")
         return {
@@ -116,24 +153,13 @@ def upload_video_file(video_file, public_id=None, video_id=None):
     try:
         # Get the file path
         file_path = video_file.path if hasattr(video_file, 'path') else None
-        if not file_path:
-            # If file is in memory or doesn't have a path, we need to save it temporarily
-            import tempfile
-            import os
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
-                for chunk in video_file.chunks():
-                    tmp_file.write(chunk)
-                tmp_file_path = tmp_file.name
-            
-            try:
-                result = upload_video_to_cloudinary(tmp_file_path, public_id)
-            finally:
-                # Clean up temp file
-                if os.path.exists(tmp_file_path):
-                    os.unlink(tmp_file_path)
-            return result
-        else:
+        if file_path:
             return upload_video_to_cloudinary(file_path, public_id)
+        # In-memory or remote-storage file: stream it straight to the
+        # uploader (which reads in chunks) instead of copying the whole
+        # file to a temp file on disk first
+        video_file.open('rb')
+        return upload_video_to_cloudinary(video_file, public_id)
     except Exception as e:
         logger.error(f"Error uploading video file to Cloudinary: {str(e)}")
         return None
@@ -153,54 +179,63 @@ def cleanup_duplicate_cloudinary_videos():
     if not CLOUDINARY_AVAILABLE:
         return {'success': False, 'error': 'Cloudinary package not installed'}
     
-    config = get_cloudinary_config()
-    if not config:
+    if not configure_cloudinary():
         return {'success': False, 'error': 'Cloudinary not configured'}
-    
+
     try:
-        cloudinary.config(
-            cloud_name=config['cloud_name'],
-            api_key=config['api_key'],
-            api_secret=config['api_secret']
-        )
-        
-        # List all videos in the videos/final folder
-        resources = cloudinary.api.resources(
-            type='upload',
-            resource_type='video',
-            prefix='videos/final/',
-            max_results=500
-        )
-        
-        # Group by video_id (extract from public_id)
+        # List all videos in the videos/final folder, following
+        # next_cursor so folders with more than 500 resources are fully
+        # scanned instead of silently truncated, and group by video_id
+        # (extracted from the public_id, format: videos/final/{video_id})
+        # while streaming the pages
         videos_by_id = {}
-        for resource in resources.get('resources', []):
-            public_id = resource.get('public_id', '')
-            # Extract video_id from public_id (format: videos/final/{video_id})
-            if '/final/' in public_id:
-                video_id = public_id.split('/final/')[-1]
-                if video_id not in videos_by_id:
-                    videos_by_id[video_id] = []
-                videos_by_id[video_id].append({
-                    'public_id': public_id,
-                    'created_at': resource.get('created_at', ''),
-                    'bytes': resource.get('bytes', 0)
-                })
+        next_cursor = None
+        while True:
+            resources = cloudinary.api.resources(
+                type='upload',
+                resource_type='video',
+                prefix='videos/final/',
+                max_results=500,
+                next_cursor=next_cursor
+            )
+            for resource in resources.get('resources', []):
+                public_id = resource.get('public_id', '')
+                if '/final/' in public_id:
+                    video_id = public_id.split('/final/')[-1]
+                    videos_by_id.setdefault(video_id, []).append({
+                        'public_id': public_id,
+                        'created_at': resource.get('created_at', ''),
+                        'bytes': resource.get('bytes', 0)
+                    })
+            next_cursor = resources.get('next_cursor')
+            if not next_cursor:
+                break
         
-        # For each video_id with multiple versions, keep only the latest
-        deleted_count = 0
+        # For each video_id with multiple versions, keep only the latest.
+        # Collect the stale versions first, then delete them in parallel:
+        # each destroy is a network round-trip, so the job is I/O-bound
+        # and wall time scales with the pool size, not the duplicate count.
+        to_delete = []
         for video_id, versions in videos_by_id.items():
             if len(versions) > 1:
                 # Sort by created_at (most recent first)
                 versions.sort(key=lambda x: x['created_at'], reverse=True)
                 # Keep the first (latest), delete the rest
-                for version in versions[1:]:
-                    try:
-                        cloudinary.uploader.destroy(version['public_id'], resource_type='video')
-                        deleted_count += 1
-                        logger.info(f"Deleted duplicate Cloudinary video: {version['public_id']}")
-                    except Exception as e:
-                        logger.warning(f"Could not delete duplicate {version['public_id']}: {e}")
+                to_delete.extend(versions[1:])
+
+        def destroy_version(version):
+            try:
+                cloudinary.uploader.destroy(version['public_id'], resource_type='video')
+                logger.info(f"Deleted duplicate Cloudinary video: {version['public_id']}")
+                return True
+            except Exception as e:
+                logger.warning(f"Could not delete duplicate {version['public_id']}: {e}")
+                return False
+
+        deleted_count = 0
+        if to_delete:
+            with ThreadPoolExecutor(max_workers=16, thread_name_prefix='cloudinary-cleanup') as pool:
+                deleted_count = sum(pool.map(destroy_version, to_delete))
         
         return {
             'success': True,
@@ -31,7 +31,7 @@ class GeminiTTSService:
             # Get API key from AIProviderSettings
             try:
                 from .models import AIProviderSettings
-                settings_obj = AIProviderSettings.objects.first()
+                settings_obj = AIProviderSettings.get_solo()
                 if settings_obj and settings_obj.api_key:
                     self.api_key = settings_obj.api_key
                     logger.info("Using Gemini API key from AIProviderSettings")
@@ -111,7 +111,7 @@ def get_google_sheets_service():
         logger.warning("Google Sheets packages not installed. Install with: pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib")
         return None
     
-    sheets_settings = GoogleSheetsSettings.objects.first()
+    sheets_settings = GoogleSheetsSettings.get_solo()
     if not sheets_settings or not sheets_settings.enabled:
         return None
     
@@ -215,7 +215,7 @@ def add_video_to_sheet(video, cloudinary_url=None):
     """
     sheets_config = get_google_sheets_service()
     if not sheets_config:
-        sheets_settings = GoogleSheetsSettings.objects.first()
+        sheets_settings = GoogleSheetsSettings.get_solo()
         if not sheets_settings:
             error_msg = "Google Sheets settings not found. Please configure in Settings."
         elif not sheets_settings.enabled:
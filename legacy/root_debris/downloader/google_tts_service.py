@@ -68,7 +68,7 @@ class GoogleTTSService:
             # Priority 2: Try to get from Google Sheets settings in database
             try:
                 from .models import GoogleSheetsSettings
-                sheets_settings = GoogleSheetsSettings.objects.first()
+                sheets_settings = GoogleSheetsSettings.get_solo()
                 if sheets_settings and sheets_settings.credentials_json:
                     credentials_dict = json.loads(sheets_settings.credentials_json)
                     self._credentials = service_account.Credentials.from_service_account_info(
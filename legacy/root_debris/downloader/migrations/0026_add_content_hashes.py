@@ -0,0 +1,23 @@
+# Generated by Django 4.2.26 on 2026-08-27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('downloader', '0025_update_watermark_to_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='videodownload',
+            name='source_sha256',
+            field=models.CharField(blank=True, db_index=True, help_text='SHA-256 of the downloaded source file (content address, used for dedupe)', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='videodownload',
+            name='final_sha256',
+            field=models.CharField(blank=True, db_index=True, help_text='SHA-256 of the final processed video file', max_length=64),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.26 on 2026-08-27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('downloader', '0026_add_content_hashes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='clonedvoice',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('is_default', True)),
+                fields=('is_default',),
+                name='uniq_default_voice',
+            ),
+        ),
+    ]
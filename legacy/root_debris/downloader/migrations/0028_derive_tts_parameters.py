@@ -0,0 +1,25 @@
+# Generated by Django 4.2.26 on 2026-08-27
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('downloader', '0027_uniq_default_voice'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='videodownload',
+            name='tts_speed',
+        ),
+        migrations.RemoveField(
+            model_name='videodownload',
+            name='tts_temperature',
+        ),
+        migrations.RemoveField(
+            model_name='videodownload',
+            name='tts_repetition_penalty',
+        ),
+    ]
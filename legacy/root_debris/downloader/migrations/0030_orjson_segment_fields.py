@@ -0,0 +1,30 @@
+# Generated by Django 4.2.26 on 2026-08-27
+
+from django.db import migrations
+
+import downloader.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('downloader', '0029_settings_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='videodownload',
+            name='whisper_transcript_segments',
+            field=downloader.models.OrjsonJSONField(blank=True, null=True, help_text='Whisper: Raw segments with timestamps and confidence scores'),
+        ),
+        migrations.AlterField(
+            model_name='videodownload',
+            name='visual_transcript_segments',
+            field=downloader.models.OrjsonJSONField(blank=True, null=True, help_text='Visual: Raw segments with timestamps and descriptions'),
+        ),
+        migrations.AlterField(
+            model_name='videodownload',
+            name='enhanced_transcript_segments',
+            field=downloader.models.OrjsonJSONField(blank=True, null=True, help_text='Enhanced: Raw segments with timestamps from AI enhancement'),
+        ),
+    ]
@@ -1,7 +1,110 @@
-from django.db import models
+import hashlib
+
+import orjson
+from django.core.cache import cache
+from django.db import connection, models, transaction
 from django.utils import timezone
+from django.utils.functional import cached_property
+
+
+class OrjsonJSONField(models.JSONField):
+    """JSONField serialized through orjson's C encoder.
+
+    The transcript segment fields hold lists with hundreds of dicts of
+    floats; orjson encodes and decodes those several times faster than
+    the stdlib json module Django's JSONField uses, which matters on
+    every save() and row load of a transcribed video. Storage format is
+    unchanged (plain JSON text), so no data migration is needed.
+    """
+
+    def get_prep_value(self, value):
+        if value is None:
+            return value
+        return orjson.dumps(value).decode()
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        try:
+            return orjson.loads(value)
+        except (TypeError, orjson.JSONDecodeError):
+            return value
+
+
+def hash_file_content(fileobj, chunk_size=1024 * 1024):
+    """Stream a file-like object through SHA-256 in 1 MiB chunks.
+
+    Used to content-address downloaded/processed video files so
+    re-processing the same source can be detected in O(1) instead of
+    re-downloading and writing a duplicate blob.
+    """
+    hasher = hashlib.sha256()
+    fileobj.seek(0)
+    for chunk in iter(lambda: fileobj.read(chunk_size), b''):
+        hasher.update(chunk)
+    fileobj.seek(0)
+    return hasher.hexdigest()
+
+
+def mask_secret(value):
+    """Mask a credential string, keeping only the last 4 characters.
+
+    rjust builds the result in a single allocation instead of creating
+    a star prefix and concatenating the tail onto it.
+    """
+    if not value:
+        return ''
+    if len(value) <= 4:
+        return '*' * len(value)
+    return value[-4:].rjust(len(value), '*')
+
+
+class CachedSingletonModel(models.Model):
+    """Base for one-row settings models with a process-shared cache.
+
+    The settings rows change a few times a day at most, but get_solo()
+    is called on every AI/TTS/upload request. Caching the row (and
+    refreshing it on save) removes a DB read from every hot path.
+    """
 
-class AIProviderSettings(models.Model):
+    CACHE_TIMEOUT = 60 * 60
+
+    # Credential fields with a cached <field>_masked property; save()
+    # drops the cached masks so rotated credentials re-mask
+    _MASK_FIELDS = ()
+
+    # Bumped on every save; response caches and ETags key on it
+    version = models.PositiveBigIntegerField(default=0, editable=False)
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def _cache_key(cls):
+        return f'downloader:settings:{cls.__name__.lower()}'
+
+    @classmethod
+    def get_solo(cls):
+        obj = cache.get(cls._cache_key())
+        if obj is None:
+            obj = cls.objects.first()
+            if obj is not None:
+                cache.set(cls._cache_key(), obj, cls.CACHE_TIMEOUT)
+        return obj
+
+    def save(self, *args, **kwargs):
+        for field in self._MASK_FIELDS:
+            self.__dict__.pop(field + '_masked', None)
+        self.version += 1
+        super().save(*args, **kwargs)
+        cache.set(self._cache_key(), self, self.CACHE_TIMEOUT)
+
+    def delete(self, *args, **kwargs):
+        cache.delete(self._cache_key())
+        super().delete(*args, **kwargs)
+
+
+class AIProviderSettings(CachedSingletonModel):
     """Store AI provider configuration for the application."""
     PROVIDER_CHOICES = [
         ('gemini', 'Gemini'),
@@ -18,8 +121,15 @@ class AIProviderSettings(models.Model):
     def __str__(self):
         return f"{self.provider} settings"
 
+    _MASK_FIELDS = ('api_key',)
 
-class CloudinarySettings(models.Model):
+    @cached_property
+    def api_key_masked(self):
+        """Masked api_key, computed once per instance."""
+        return mask_secret(self.api_key)
+
+
+class CloudinarySettings(CachedSingletonModel):
     """Store Cloudinary configuration for video uploads."""
     cloud_name = models.CharField(max_length=255, blank=True, help_text="Cloudinary cloud name")
     api_key = models.CharField(max_length=255, blank=True, help_text="Cloudinary API key")
@@ -33,8 +143,20 @@ class CloudinarySettings(models.Model):
     def __str__(self):
         return f"Cloudinary settings ({'enabled' if self.enabled else 'disabled'})"
 
+    _MASK_FIELDS = ('api_key', 'api_secret')
+
+    @cached_property
+    def api_key_masked(self):
+        """Masked api_key, computed once per instance."""
+        return mask_secret(self.api_key)
 
-class GoogleSheetsSettings(models.Model):
+    @cached_property
+    def api_secret_masked(self):
+        """Masked api_secret, computed once per instance."""
+        return mask_secret(self.api_secret)
+
+
+class GoogleSheetsSettings(CachedSingletonModel):
     """Store Google Sheets configuration for tracking."""
     spreadsheet_id = models.CharField(max_length=255, blank=True, help_text="Google Sheets spreadsheet ID")
     sheet_name = models.CharField(max_length=255, default='Sheet1', help_text="Sheet name to write data to")
@@ -49,7 +171,7 @@ class GoogleSheetsSettings(models.Model):
         return f"Google Sheets settings ({'enabled' if self.enabled else 'disabled'})"
 
 
-class WatermarkSettings(models.Model):
+class WatermarkSettings(CachedSingletonModel):
     """Store watermark configuration for videos."""
     enabled = models.BooleanField(default=False, help_text="Enable watermark on videos")
     watermark_text = models.CharField(max_length=100, blank=True, default='', help_text="Watermark text to display on videos")
@@ -74,20 +196,54 @@ class ClonedVoice(models.Model):
 
     class Meta:
         ordering = ['-is_default', '-created_at']
-
-    def save(self, *args, **kwargs):
-        # Ensure only one default voice exists
-        if self.is_default:
-            ClonedVoice.objects.filter(is_default=True).exclude(pk=self.pk).update(is_default=False)
-        super().save(*args, **kwargs)
+        constraints = [
+            # "At most one default voice" enforced at the DB level; callers
+            # that switch defaults unset the old one and set the new one
+            # inside transaction.atomic() (see admin/xtts_views).
+            models.UniqueConstraint(
+                fields=['is_default'],
+                condition=models.Q(is_default=True),
+                name='uniq_default_voice',
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
 
+class VideoDownloadManager(models.Manager):
+    """Default manager that always joins the voice profile.
+
+    Every list view and the synthesis pipeline touch vd.voice_profile;
+    without the join each row costs one extra query (classic N+1).
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('voice_profile')
+
+    def transition(self, ids, **fields):
+        """Batch status transition: one UPDATE, no Python-side fetch.
+
+        updated_at is set explicitly because queryset update() bypasses
+        auto_now.
+        """
+        return self.filter(pk__in=ids).update(updated_at=timezone.now(), **fields)
+
+    def for_dashboard(self):
+        """Narrow queryset for list/dashboard views.
+
+        Fetches only the columns the list serializer renders, skipping
+        the transcript/segment blobs — per-row wire size drops from
+        several KB to a couple hundred bytes. The column list itself is
+        owned by VideoDownloadListSerializer so the two can't drift.
+        """
+        from .serializers import VideoDownloadListSerializer
+        return VideoDownloadListSerializer.setup_eager_loading(self.get_queryset())
+
+
 class VideoDownload(models.Model):
     """Model to track video downloads from Xiaohongshu/RedNote"""
-    
+
     STATUS_CHOICES = [
         ('success', 'Success'),
         ('failed', 'Failed'),
@@ -152,6 +308,8 @@ class VideoDownload(models.Model):
     voice_removed_video_url = models.URLField(max_length=1000, blank=True, help_text="2. Video URL after removing original audio (no audio)")
     final_processed_video = models.FileField(upload_to='videos/final/', blank=True, null=True, help_text="3. Final video file after TTS audio replacement (with new Hindi audio)")
     final_processed_video_url = models.URLField(max_length=1000, blank=True, help_text="3. Final video URL after TTS audio replacement (with new Hindi audio)")
+    source_sha256 = models.CharField(max_length=64, blank=True, db_index=True, help_text="SHA-256 of the downloaded source file (content address, used for dedupe)")
+    final_sha256 = models.CharField(max_length=64, blank=True, db_index=True, help_text="SHA-256 of the final processed video file")
     
     # Metadata
     extraction_method = models.CharField(
@@ -206,7 +364,7 @@ class VideoDownload(models.Model):
     whisper_transcript_without_timestamps = models.TextField(blank=True, help_text="Whisper: Full transcript WITHOUT timestamps (plain text)")
     whisper_transcript_hindi = models.TextField(blank=True, help_text="Whisper: Hindi translation of the transcript")
     whisper_transcript_language = models.CharField(max_length=10, blank=True, help_text="Whisper: Detected language (ISO code)")
-    whisper_transcript_segments = models.JSONField(blank=True, null=True, help_text="Whisper: Raw segments with timestamps and confidence scores")
+    whisper_transcript_segments = OrjsonJSONField(blank=True, null=True, help_text="Whisper: Raw segments with timestamps and confidence scores")
     whisper_transcript_started_at = models.DateTimeField(blank=True, null=True, help_text="When Whisper transcription started")
     whisper_transcript_processed_at = models.DateTimeField(blank=True, null=True, help_text="When Whisper transcription was completed")
     whisper_transcript_error_message = models.TextField(blank=True, help_text="Whisper: Transcription error message if failed")
@@ -218,23 +376,26 @@ class VideoDownload(models.Model):
     visual_transcript = models.TextField(blank=True, help_text="Visual: Frame-by-frame description WITH timestamps (HH:MM:SS format)")
     visual_transcript_without_timestamps = models.TextField(blank=True, help_text="Visual: Frame-by-frame description WITHOUT timestamps (plain text)")
     visual_transcript_hindi = models.TextField(blank=True, help_text="Visual: Hindi translation of visual description")
-    visual_transcript_segments = models.JSONField(blank=True, null=True, help_text="Visual: Raw segments with timestamps and descriptions")
+    visual_transcript_segments = OrjsonJSONField(blank=True, null=True, help_text="Visual: Raw segments with timestamps and descriptions")
     
     # AI-Enhanced Transcription (merges Whisper + NCA + Visual using AI)
     enhanced_transcript = models.TextField(blank=True, help_text="Enhanced: AI-merged transcript WITH timestamps (HH:MM:SS format) - combines Whisper, NCA, and Visual")
     enhanced_transcript_without_timestamps = models.TextField(blank=True, help_text="Enhanced: AI-merged transcript WITHOUT timestamps (plain text)")
     enhanced_transcript_hindi = models.TextField(blank=True, help_text="Enhanced: Hindi translation of enhanced transcript")
-    enhanced_transcript_segments = models.JSONField(blank=True, null=True, help_text="Enhanced: Raw segments with timestamps from AI enhancement")
+    enhanced_transcript_segments = OrjsonJSONField(blank=True, null=True, help_text="Enhanced: Raw segments with timestamps from AI enhancement")
     
     
     # Timestamps
     created_at = models.DateTimeField(default=timezone.now, help_text="When the download was requested")
     updated_at = models.DateTimeField(auto_now=True, help_text="Last update time")
-    
+
+    objects = VideoDownloadManager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Video Download"
         verbose_name_plural = "Video Downloads"
+        default_related_name = 'video_downloads'
     
     def __str__(self):
         return f"{self.title[:50] if self.title else 'Untitled'} - {self.status}"
@@ -249,6 +410,50 @@ class VideoDownload(models.Model):
         """Check if AI processing is completed"""
         return self.ai_processing_status == 'processed'
 
+    @property
+    def tts_parameters(self):
+        """TTS parameters derived from duration (never stale, never stored)"""
+        from .utils import calculate_tts_parameters
+        return calculate_tts_parameters(self.duration)
+
+    @property
+    def tts_speed(self):
+        return self.tts_parameters['speed']
+
+    @property
+    def tts_temperature(self):
+        return self.tts_parameters['temperature']
+
+    @property
+    def tts_repetition_penalty(self):
+        return self.tts_parameters['repetition_penalty']
+
+    @classmethod
+    def claim_next(cls, field, from_state, to_state):
+        """Atomically claim the oldest row whose `field` is `from_state`.
+
+        Locks the row and flips it to `to_state` in one transaction so
+        concurrent workers never double-process the same video — the
+        table acts as a work queue without an external broker. Returns
+        the claimed instance, or None when nothing is pending.
+        """
+        with transaction.atomic():
+            qs = (
+                cls.objects.select_related(None)
+                .filter(**{field: from_state})
+                .order_by('created_at')
+            )
+            if connection.features.has_select_for_update:
+                qs = qs.select_for_update(
+                    skip_locked=connection.features.has_select_for_update_skip_locked
+                )
+            video = qs.first()
+            if video is None:
+                return None
+            setattr(video, field, to_state)
+            video.save(update_fields=[field, 'updated_at'])
+            return video
+
     # Audio Synthesis
     SYNTHESIS_STATUS_CHOICES = [
         ('not_synthesized', 'Not Synthesized'),
@@ -285,11 +490,9 @@ class VideoDownload(models.Model):
     script_error_message = models.TextField(blank=True, help_text="Script generation error message if failed")
     script_generated_at = models.DateTimeField(blank=True, null=True, help_text="When script was generated")
     
-    # TTS Parameters (calculated based on duration)
-    tts_speed = models.FloatField(default=1.0, help_text="TTS speed multiplier (calculated from duration)")
-    tts_temperature = models.FloatField(default=0.75, help_text="TTS temperature parameter")
-    tts_repetition_penalty = models.FloatField(default=5.0, help_text="TTS repetition penalty")
-    
+    # TTS parameters are derived from duration (utils.calculate_tts_parameters),
+    # not stored — see the tts_* properties below.
+
     # Video Review Status
     REVIEW_STATUS_CHOICES = [
         ('pending_review', 'Pending Review'),
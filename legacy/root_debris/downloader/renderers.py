@@ -0,0 +1,27 @@
+"""
+orjson-backed JSON renderer for API responses
+"""
+import orjson
+
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Render API responses with orjson's C encoder.
+
+    VideoDownload payloads carry several multi-KB transcript strings;
+    orjson encodes them several times faster than the stdlib json
+    module behind DRF's default JSONRenderer. orjson natively handles
+    datetimes (ISO 8601) and dict/list/str subclasses, which covers
+    DRF's ReturnDict/ReturnList and ErrorDetail; anything else falls
+    back to str().
+    """
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None  # orjson emits UTF-8 bytes directly
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=str)
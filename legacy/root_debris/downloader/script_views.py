@@ -60,7 +60,7 @@ Please generate the script now."""
         # 4. Get AI Provider Settings
         api_key = None
         try:
-            settings_obj = AIProviderSettings.objects.first()
+            settings_obj = AIProviderSettings.get_solo()
             if settings_obj and settings_obj.api_key:
                 api_key = settings_obj.api_key
                 # Use the provider from request if provided, otherwise use settings default
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import VideoDownload, AIProviderSettings, ClonedVoice, CloudinarySettings, GoogleSheetsSettings, WatermarkSettings
+from .utils import get_clean_script_for_tts
 
 
 class AIProviderSettingsSerializer(serializers.ModelSerializer):
@@ -7,19 +8,12 @@ class AIProviderSettingsSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AIProviderSettings
-        fields = ['id', 'provider', 'api_key']
-
-    def to_representation(self, instance):
-        """Mask API key in responses"""
-        data = super().to_representation(instance)
-        if data.get('api_key'):
-            # Show only last 4 characters
-            api_key = data['api_key']
-            if len(api_key) > 4:
-                data['api_key_masked'] = '*' * (len(api_key) - 4) + api_key[-4:]
-            else:
-                data['api_key_masked'] = '*' * len(api_key)
-        return data
+        # api_key_masked is a cached_property on the model, so the mask
+        # is computed once per instance rather than per response
+        fields = ['id', 'provider', 'api_key', 'api_key_masked']
+        # Dump-only: writes go through the viewset directly, and fully
+        # read-only fields skip DRF's writable-field/validator setup
+        read_only_fields = fields
 
 
 class CloudinarySettingsSerializer(serializers.ModelSerializer):
@@ -27,24 +21,11 @@ class CloudinarySettingsSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = CloudinarySettings
-        fields = ['id', 'cloud_name', 'api_key', 'api_secret', 'enabled']
-
-    def to_representation(self, instance):
-        """Mask API key and secret in responses"""
-        data = super().to_representation(instance)
-        if data.get('api_key'):
-            api_key = data['api_key']
-            if len(api_key) > 4:
-                data['api_key_masked'] = '*' * (len(api_key) - 4) + api_key[-4:]
-            else:
-                data['api_key_masked'] = '*' * len(api_key)
-        if data.get('api_secret'):
-            api_secret = data['api_secret']
-            if len(api_secret) > 4:
-                data['api_secret_masked'] = '*' * (len(api_secret) - 4) + api_secret[-4:]
-            else:
-                data['api_secret_masked'] = '*' * len(api_secret)
-        return data
+        fields = [
+            'id', 'cloud_name', 'api_key', 'api_key_masked',
+            'api_secret', 'api_secret_masked', 'enabled',
+        ]
+        read_only_fields = fields
 
 
 class GoogleSheetsSettingsSerializer(serializers.ModelSerializer):
@@ -53,6 +34,7 @@ class GoogleSheetsSettingsSerializer(serializers.ModelSerializer):
     class Meta:
         model = GoogleSheetsSettings
         fields = ['id', 'spreadsheet_id', 'sheet_name', 'credentials_json', 'enabled']
+        read_only_fields = fields
 
     def to_representation(self, instance):
         """Mask credentials JSON in responses"""
@@ -69,6 +51,7 @@ class WatermarkSettingsSerializer(serializers.ModelSerializer):
     class Meta:
         model = WatermarkSettings
         fields = ['id', 'enabled', 'watermark_text', 'font_size', 'font_color', 'opacity', 'position_change_interval']
+        read_only_fields = fields
 
 class ClonedVoiceSerializer(serializers.ModelSerializer):
     file_url = serializers.SerializerMethodField()
@@ -80,60 +63,57 @@ class ClonedVoiceSerializer(serializers.ModelSerializer):
     
     def get_file_url(self, obj):
         if obj.file:
-            try:
-                request = self.context.get('request')
-                if request:
-                    try:
-                        return request.build_absolute_uri(obj.file.url)
-                    except Exception:
-                        # Fallback if build_absolute_uri fails
-                        return obj.file.url
-                return obj.file.url
-            except Exception:
-                # Fallback if file.url fails
-                return None
+            request = self.context.get('request')
+            if request:
+                return request.build_absolute_uri(obj.file.url)
+            return obj.file.url
         return None
 
 
+def parse_field_pruning_params(params):
+    """Parse ?fields= / ?omit= query params into (keep, omitted).
+
+    keep is None when no ?fields= was given (meaning keep everything
+    not omitted); omitted is always a set.
+    """
+    fields_param = params.get('fields')
+    omit_param = params.get('omit')
+    keep = None
+    if fields_param:
+        keep = {f.strip() for f in fields_param.split(',') if f.strip()}
+    omitted = {f.strip() for f in omit_param.split(',')} if omit_param else set()
+    return keep, omitted
+
+
 class VideoDownloadSerializer(serializers.ModelSerializer):
-    """Full serializer for Video Downloads"""
+    """Full serializer for Video Downloads.
+
+    Supports response pruning via ?fields=a,b (keep only those) and
+    ?omit=a,b (drop those), so metadata-only clients don't pay for the
+    multi-KB transcript payloads. The viewset pairs this with .defer()
+    on the heavy columns so pruned transcripts are never read from the
+    database either.
+    """
+
+    # Multi-KB TextField columns worth deferring when pruned
+    HEAVY_TEXT_FIELDS = (
+        'transcript', 'transcript_without_timestamps', 'transcript_hindi',
+        'whisper_transcript', 'whisper_transcript_without_timestamps', 'whisper_transcript_hindi',
+        'visual_transcript', 'visual_transcript_without_timestamps', 'visual_transcript_hindi',
+        'enhanced_transcript', 'enhanced_transcript_without_timestamps', 'enhanced_transcript_hindi',
+        'hindi_script',
+    )
+    # Method fields are kept only where a value is actually computed:
+    # absolute URL builders and the cleaned TTS script. Everything else
+    # (whisper/visual/enhanced transcripts, script, review, duration,
+    # has_audio, tts parameters) maps straight off the model, letting
+    # DRF emit the column values without a Python getter per field per
+    # row.
     local_file_url = serializers.SerializerMethodField()
     voice_removed_video_url = serializers.SerializerMethodField()
     final_processed_video_url = serializers.SerializerMethodField()
-    # Use SerializerMethodField for new fields to avoid database queries if migration hasn't been run
-    duration = serializers.SerializerMethodField()
-    script_status = serializers.SerializerMethodField()
-    hindi_script = serializers.SerializerMethodField()
-    clean_script_for_tts = serializers.SerializerMethodField()
-    script_error_message = serializers.SerializerMethodField()
-    script_generated_at = serializers.SerializerMethodField()
-    tts_speed = serializers.SerializerMethodField()
-    tts_temperature = serializers.SerializerMethodField()
-    tts_repetition_penalty = serializers.SerializerMethodField()
     synthesized_audio_url = serializers.SerializerMethodField()
-    review_status = serializers.SerializerMethodField()
-    review_notes = serializers.SerializerMethodField()
-    reviewed_at = serializers.SerializerMethodField()
-    # Whisper transcription fields
-    whisper_transcription_status = serializers.SerializerMethodField()
-    whisper_transcript = serializers.SerializerMethodField()
-    whisper_transcript_without_timestamps = serializers.SerializerMethodField()
-    whisper_transcript_hindi = serializers.SerializerMethodField()
-    whisper_transcript_language = serializers.SerializerMethodField()
-    whisper_model_used = serializers.SerializerMethodField()
-    whisper_confidence_avg = serializers.SerializerMethodField()
-    whisper_transcript_started_at = serializers.SerializerMethodField()
-    whisper_transcript_processed_at = serializers.SerializerMethodField()
-    whisper_transcript_error_message = serializers.SerializerMethodField()
-    # Visual transcription fields
-    has_audio = serializers.SerializerMethodField()
-    visual_transcript = serializers.SerializerMethodField()
-    visual_transcript_without_timestamps = serializers.SerializerMethodField()
-    visual_transcript_hindi = serializers.SerializerMethodField()
-    # Enhanced transcription fields
-    enhanced_transcript = serializers.SerializerMethodField()
-    enhanced_transcript_without_timestamps = serializers.SerializerMethodField()
-    enhanced_transcript_hindi = serializers.SerializerMethodField()
+    clean_script_for_tts = serializers.SerializerMethodField()
 
     class Meta:
         model = VideoDownload
@@ -182,259 +162,69 @@ class VideoDownloadSerializer(serializers.ModelSerializer):
             'ai_processed_at', 'transcript_started_at', 'transcript_processed_at',
         ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        params = getattr(request, 'query_params', None)
+        if params is None:
+            return
+        keep, omitted = parse_field_pruning_params(params)
+        if keep is None and not omitted:
+            return
+        for name in list(self.fields):
+            if name in omitted or (keep is not None and name not in keep):
+                del self.fields[name]
+
+    def _absolute_url(self, field_file):
+        """Build an absolute URL for a FieldFile.
+
+        The scheme://host prefix is identical for every row of a
+        response, so it's computed once per serializer instance instead
+        of re-deriving it via build_absolute_uri per field per row.
+        """
+        url = field_file.url
+        base = getattr(self, '_base_uri', None)
+        if base is None:
+            request = self.context.get('request')
+            base = f"{request.scheme}://{request.get_host()}" if request else ''
+            self._base_uri = base
+        if base and url.startswith('/'):
+            return base + url
+        return url
+
     def get_local_file_url(self, obj):
         """Get full URL for local file"""
         if obj.local_file:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.local_file.url)
-            return obj.local_file.url
+            return self._absolute_url(obj.local_file)
         return None
-    
+
     def get_voice_removed_video_url(self, obj):
         """Get full URL for voice removed video file"""
         if obj.voice_removed_video:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.voice_removed_video.url)
-            return obj.voice_removed_video.url
+            return self._absolute_url(obj.voice_removed_video)
         return obj.voice_removed_video_url or None
-    
+
     def get_final_processed_video_url(self, obj):
         """Get full URL for final processed video file"""
         if obj.final_processed_video:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.final_processed_video.url)
-            return obj.final_processed_video.url
+            return self._absolute_url(obj.final_processed_video)
         return obj.final_processed_video_url or None
-    
-    def get_duration(self, obj):
-        """Safely get duration field"""
-        try:
-            return getattr(obj, 'duration', None)
-        except (AttributeError, ValueError):
-            return None
-    
-    def get_script_status(self, obj):
-        """Safely get script_status field"""
-        try:
-            return getattr(obj, 'script_status', 'not_generated')
-        except (AttributeError, ValueError):
-            return 'not_generated'
-    
-    def get_hindi_script(self, obj):
-        """Safely get hindi_script field"""
-        try:
-            return getattr(obj, 'hindi_script', '')
-        except (AttributeError, ValueError):
-            return ''
-    
+
     def get_clean_script_for_tts(self, obj):
         """Get clean script text for TTS (without formatting headers)"""
-        from .utils import get_clean_script_for_tts
-        try:
-            script = getattr(obj, 'hindi_script', '')
-            if script:
-                return get_clean_script_for_tts(script)
-            return ''
-        except (AttributeError, ValueError):
-            return ''
-    
-    def get_script_error_message(self, obj):
-        """Safely get script_error_message field"""
-        try:
-            return getattr(obj, 'script_error_message', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    def get_script_generated_at(self, obj):
-        """Safely get script_generated_at field"""
-        try:
-            return getattr(obj, 'script_generated_at', None)
-        except (AttributeError, ValueError):
-            return None
-    
-    def get_tts_speed(self, obj):
-        """Safely get tts_speed field"""
-        try:
-            return getattr(obj, 'tts_speed', 1.0)
-        except (AttributeError, ValueError):
-            return 1.0
-    
-    def get_tts_temperature(self, obj):
-        """Safely get tts_temperature field"""
-        try:
-            return getattr(obj, 'tts_temperature', 0.75)
-        except (AttributeError, ValueError):
-            return 0.75
-    
-    def get_tts_repetition_penalty(self, obj):
-        """Safely get tts_repetition_penalty field"""
-        try:
-            return getattr(obj, 'tts_repetition_penalty', 5.0)
-        except (AttributeError, ValueError):
-            return 5.0
-    
+        return get_clean_script_for_tts(obj.hindi_script) if obj.hindi_script else ''
+
     def get_synthesized_audio_url(self, obj):
         """Get full URL for synthesized audio file"""
         if obj.synthesized_audio:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.synthesized_audio.url)
-            return obj.synthesized_audio.url
+            return self._absolute_url(obj.synthesized_audio)
         return None
     
-    def get_review_status(self, obj):
-        """Safely get review_status field"""
-        try:
-            return getattr(obj, 'review_status', 'pending_review')
-        except (AttributeError, ValueError):
-            return 'pending_review'
-    
-    def get_review_notes(self, obj):
-        """Safely get review_notes field"""
-        try:
-            return getattr(obj, 'review_notes', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    def get_reviewed_at(self, obj):
-        """Safely get reviewed_at field"""
-        try:
-            return getattr(obj, 'reviewed_at', None)
-        except (AttributeError, ValueError):
-            return None
-    
-    # Whisper transcription getters
-    def get_whisper_transcription_status(self, obj):
-        """Safely get whisper_transcription_status field"""
-        try:
-            return getattr(obj, 'whisper_transcription_status', 'not_transcribed')
-        except (AttributeError, ValueError):
-            return 'not_transcribed'
-    
-    def get_whisper_transcript(self, obj):
-        """Safely get whisper_transcript field"""
-        try:
-            return getattr(obj, 'whisper_transcript', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    def get_whisper_transcript_without_timestamps(self, obj):
-        """Safely get whisper_transcript_without_timestamps field"""
-        try:
-            return getattr(obj, 'whisper_transcript_without_timestamps', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    def get_whisper_transcript_hindi(self, obj):
-        """Safely get whisper_transcript_hindi field"""
-        try:
-            return getattr(obj, 'whisper_transcript_hindi', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    def get_whisper_transcript_language(self, obj):
-        """Safely get whisper_transcript_language field"""
-        try:
-            return getattr(obj, 'whisper_transcript_language', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    def get_whisper_model_used(self, obj):
-        """Safely get whisper_model_used field"""
-        try:
-            return getattr(obj, 'whisper_model_used', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    def get_whisper_confidence_avg(self, obj):
-        """Safely get whisper_confidence_avg field"""
-        try:
-            return getattr(obj, 'whisper_confidence_avg', None)
-        except (AttributeError, ValueError):
-            return None
-    
-    def get_whisper_transcript_started_at(self, obj):
-        """Safely get whisper_transcript_started_at field"""
-        try:
-            return getattr(obj, 'whisper_transcript_started_at', None)
-        except (AttributeError, ValueError):
-            return None
-    
-    def get_whisper_transcript_processed_at(self, obj):
-        """Safely get whisper_transcript_processed_at field"""
-        try:
-            return getattr(obj, 'whisper_transcript_processed_at', None)
-        except (AttributeError, ValueError):
-            return None
-    
-    def get_whisper_transcript_error_message(self, obj):
-        """Safely get whisper_transcript_error_message field"""
-        try:
-            return getattr(obj, 'whisper_transcript_error_message', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    # Visual transcription getters
-    def get_has_audio(self, obj):
-        """Safely get has_audio field"""
-        try:
-            return getattr(obj, 'has_audio', True)
-        except (AttributeError, ValueError):
-            return True
-    
-    def get_visual_transcript(self, obj):
-        """Safely get visual_transcript field"""
-        try:
-            return getattr(obj, 'visual_transcript', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    def get_visual_transcript_without_timestamps(self, obj):
-        """Safely get visual_transcript_without_timestamps field"""
-        try:
-            return getattr(obj, 'visual_transcript_without_timestamps', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    def get_visual_transcript_hindi(self, obj):
-        """Safely get visual_transcript_hindi field"""
-        try:
-            return getattr(obj, 'visual_transcript_hindi', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    # Enhanced transcription getters
-    def get_enhanced_transcript(self, obj):
-        """Safely get enhanced_transcript field"""
-        try:
-            return getattr(obj, 'enhanced_transcript', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    def get_enhanced_transcript_without_timestamps(self, obj):
-        """Safely get enhanced_transcript_without_timestamps field"""
-        try:
-            return getattr(obj, 'enhanced_transcript_without_timestamps', '')
-        except (AttributeError, ValueError):
-            return ''
-    
-    def get_enhanced_transcript_hindi(self, obj):
-        """Safely get enhanced_transcript_hindi field"""
-        try:
-            return getattr(obj, 'enhanced_transcript_hindi', '')
-        except (AttributeError, ValueError):
-            return ''
 
 
 class VideoDownloadListSerializer(serializers.ModelSerializer):
     """Lighter serializer for list views"""
     local_file_url = serializers.SerializerMethodField()
-    # Use SerializerMethodField to avoid database queries if migration hasn't been run
-    duration = serializers.SerializerMethodField()
-    script_status = serializers.SerializerMethodField()
 
     class Meta:
         model = VideoDownload
@@ -444,6 +234,26 @@ class VideoDownloadListSerializer(serializers.ModelSerializer):
             'transcription_status', 'ai_processing_status', 'script_status',
             'duration', 'created_at'
         ]
+        # List responses only — never used for input
+        read_only_fields = fields
+
+    # Derived once from Meta.fields: rendered columns plus local_file,
+    # which backs the local_file_url method field
+    _EAGER_ONLY_FIELDS = None
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Narrow a queryset to exactly the columns this serializer renders.
+
+        Keeps the column list in one place (Meta.fields) so the list
+        endpoint can't drift out of sync with the serializer, and drops
+        the default voice_profile join the manager applies.
+        """
+        if cls._EAGER_ONLY_FIELDS is None:
+            fields = [f for f in cls.Meta.fields if f != 'local_file_url']
+            fields.append('local_file')
+            cls._EAGER_ONLY_FIELDS = tuple(fields)
+        return queryset.select_related(None).only(*cls._EAGER_ONLY_FIELDS)
 
     def get_local_file_url(self, obj):
         if obj.local_file:
@@ -452,20 +262,45 @@ class VideoDownloadListSerializer(serializers.ModelSerializer):
                 return request.build_absolute_uri(obj.local_file.url)
             return obj.local_file.url
         return None
-    
-    def get_duration(self, obj):
-        """Safely get duration field"""
-        try:
-            return getattr(obj, 'duration', None)
-        except (AttributeError, ValueError):
-            return None
-    
-    def get_script_status(self, obj):
-        """Safely get script_status field"""
-        try:
-            return getattr(obj, 'script_status', 'not_generated')
-        except (AttributeError, ValueError):
-            return 'not_generated'
+
+
+def serialize_video_list_fast(videos, request=None):
+    """Serialize VideoDownload rows for the list endpoint as plain dicts.
+
+    Skips DRF's per-field binding and to_representation machinery,
+    which dominates CPU on large list responses. The field set mirrors
+    VideoDownloadListSerializer, which stays as the documented shape
+    for the browsable API and any non-hot-path callers.
+    """
+    # One scheme://host prefix for the whole response
+    base_uri = f"{request.scheme}://{request.get_host()}" if request is not None else ''
+    data = []
+    for video in videos:
+        local_file = video.local_file
+        if local_file:
+            url = local_file.url
+            local_file_url = base_uri + url if base_uri and url.startswith('/') else url
+        else:
+            local_file_url = None
+        created_at = video.created_at
+        data.append({
+            'id': video.id,
+            'url': video.url,
+            'video_id': video.video_id,
+            'title': video.title,
+            'cover_url': video.cover_url,
+            'video_url': video.video_url,
+            'status': video.status,
+            'extraction_method': video.extraction_method,
+            'is_downloaded': video.is_downloaded,
+            'local_file_url': local_file_url,
+            'transcription_status': video.transcription_status,
+            'ai_processing_status': video.ai_processing_status,
+            'script_status': video.script_status,
+            'duration': video.duration,
+            'created_at': created_at.isoformat() if created_at else None,
+        })
+    return data
 
 
 class VideoExtractSerializer(serializers.Serializer):
@@ -491,15 +326,3 @@ class BulkActionSerializer(serializers.Serializer):
         required=True,
         help_text="List of video IDs"
     )
-
-
-class DashboardStatsSerializer(serializers.Serializer):
-    """Serializer for dashboard statistics"""
-    total_videos = serializers.IntegerField()
-    successful_extractions = serializers.IntegerField()
-    downloaded_locally = serializers.IntegerField()
-    transcribed = serializers.IntegerField()
-    ai_processed = serializers.IntegerField()
-    audio_prompts_generated = serializers.IntegerField()
-    synthesized = serializers.IntegerField()
-    failed = serializers.IntegerField()
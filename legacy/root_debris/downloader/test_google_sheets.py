@@ -22,7 +22,7 @@ def test_google_sheets_config():
     print("=" * 60)
     
     # Check if settings exist
-    sheets_settings = GoogleSheetsSettings.objects.first()
+    sheets_settings = GoogleSheetsSettings.get_solo()
     
     if not sheets_settings:
         print("❌ ERROR: Google Sheets settings not found in database")
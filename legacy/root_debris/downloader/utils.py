@@ -1,12 +1,15 @@
 import os
 import re
 import json
+import hashlib
 import tempfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from urllib.parse import urlparse
 from pathlib import Path
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.base import ContentFile
 from deep_translator import GoogleTranslator
 import requests
@@ -132,6 +135,18 @@ def translate_text(text, target='en', use_ai=None):
         return text
 
 
+# AI results keyed by content hash, so re-running the pipeline on the
+# same video (retries, re-processing) doesn't re-pay for identical LLM
+# calls. A cache hit costs no tokens and no network round trip.
+LLM_CACHE_TTL = 30 * 86400
+
+
+def llm_cache_key(namespace, *parts):
+    """Build a cache key from a namespace and hashed content parts."""
+    digest = hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+    return f'llm:{namespace}:{digest}'
+
+
 def translate_text_with_ai(text, target='hi', source='auto'):
     """
     Translate text using AI (Gemini/OpenAI/Anthropic) for better quality and meaning preservation
@@ -151,11 +166,18 @@ def translate_text_with_ai(text, target='hi', source='auto'):
         from .models import AIProviderSettings
         
         # Get AI provider settings
-        settings_obj = AIProviderSettings.objects.first()
+        settings_obj = AIProviderSettings.get_solo()
         if not settings_obj or not settings_obj.api_key:
             # Fallback to GoogleTranslator if AI not configured
             print("⚠ AI not configured for translation, using GoogleTranslator fallback")
             return GoogleTranslator(source=source, target=target).translate(text)
+
+        # Return a previously computed translation for identical input
+        cache_key = llm_cache_key('translate', settings_obj.provider, target, text)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            print(f"✓ AI translation cache hit ({len(text)} chars)")
+            return cached
         
         # Check if text contains timestamps
         has_timestamps = bool(re.search(r'\d{1,2}:\d{2}:\d{2}\s+', text))
@@ -240,6 +262,7 @@ Return ONLY the translated text, nothing else."""
                             translated_text = '\n'.join(restored_lines)
                 
                 print(f"✓ AI translation complete: {len(text)} chars -> {len(translated_text)} chars")
+                cache.set(cache_key, translated_text, LLM_CACHE_TTL)
                 return translated_text
             else:
                 # Fallback if AI returns empty
@@ -261,6 +284,60 @@ Return ONLY the translated text, nothing else."""
         except:
             return text
 
+# Sentinel used to pack multiple texts into one translation request
+_TRANSLATE_BATCH_SENTINEL = '\n<<<SEG>>>\n'
+
+
+def translate_texts_with_ai(texts, target='hi', source='auto'):
+    """
+    Translate several texts in a single AI request.
+
+    Packs the texts into one prompt separated by a sentinel marker and
+    splits the response back out, so N translations cost one API round
+    trip instead of N. Falls back to per-text translate_text_with_ai
+    calls if the model does not preserve the sentinels.
+
+    Args:
+        texts: List of texts to translate (empty entries pass through)
+        target: Target language code (default 'hi' for Hindi)
+        source: Source language (default 'auto' for auto-detect)
+
+    Returns:
+        list: Translated texts, in the same order as the input
+    """
+    non_empty = [(i, t) for i, t in enumerate(texts) if t]
+    results = ['' for _ in texts]
+    if not non_empty:
+        return results
+
+    if len(non_empty) == 1:
+        idx, text = non_empty[0]
+        results[idx] = translate_text_with_ai(text, target=target, source=source)
+        return results
+
+    combined = _TRANSLATE_BATCH_SENTINEL.join(t for _, t in non_empty)
+    translated = translate_text_with_ai(combined, target=target, source=source)
+    parts = [p.strip() for p in translated.split('<<<SEG>>>')] if translated else []
+
+    if len(parts) == len(non_empty):
+        for (idx, _), part in zip(non_empty, parts):
+            results[idx] = part
+        return results
+
+    # Sentinels were lost in translation - translate individually, but
+    # fan the round trips out over a small pool (each call is pure
+    # network wait) so the fallback costs ~one latency, not one per text
+    print("⚠ Batched translation lost segment markers, translating individually")
+    with ThreadPoolExecutor(max_workers=5, thread_name_prefix='ai-translate') as pool:
+        translated = pool.map(
+            lambda item: translate_text_with_ai(item[1], target=target, source=source),
+            non_empty,
+        )
+        for (idx, _), part in zip(non_empty, translated):
+            results[idx] = part
+    return results
+
+
 def perform_extraction(url):
     """Perform video extraction using multiple methods
     
@@ -937,7 +1014,7 @@ def process_video_with_ai(video_download):
         tags = []
         
         try:
-            settings_obj = AIProviderSettings.objects.first()
+            settings_obj = AIProviderSettings.get_solo()
             if settings_obj and settings_obj.api_key:
                 print(f"Using AI Provider: {settings_obj.provider}")
                 
@@ -1284,6 +1361,66 @@ def extract_audio_from_video(video_path, output_audio_path=None):
         traceback.print_exc()
         return None
 
+def extract_audio_to_numpy(video_path):
+    """
+    Decode a video's audio track straight into a Whisper-ready array.
+
+    Pipes ffmpeg's 16kHz mono PCM output through stdout instead of
+    writing a temp WAV that Whisper immediately reads back, so the audio
+    bytes never touch disk and there is no temp file to clean up.
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        numpy.ndarray: float32 mono samples at 16kHz, or None if failed
+    """
+    try:
+        import numpy as np
+
+        ffmpeg_path = find_ffmpeg()
+        if not ffmpeg_path:
+            print("ERROR: ffmpeg not found. Please install ffmpeg or ensure it's in your PATH.")
+            return None
+
+        if not os.path.exists(video_path):
+            print(f"ERROR: Video file does not exist: {video_path}")
+            return None
+
+        cmd = [
+            ffmpeg_path,
+            '-i', video_path,
+            '-vn',  # No video
+            '-f', 's16le',  # Raw PCM on stdout
+            '-acodec', 'pcm_s16le',  # PCM 16-bit
+            '-ar', '16000',  # Sample rate 16kHz (good for Whisper)
+            '-ac', '1',  # Mono channel
+            '-',
+        ]
+
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            timeout=300  # 5 minute timeout
+        )
+
+        if result.returncode != 0 or not result.stdout:
+            error_msg = result.stderr.decode(errors='replace') if result.stderr else 'Unknown error'
+            if 'does not contain any stream' in error_msg.lower() or 'no stream' in error_msg.lower():
+                print("ERROR: Video file has no audio stream. This video is video-only with no audio track.")
+            else:
+                print(f"FFmpeg error (return code {result.returncode}): {error_msg[:500]}")
+            return None
+
+        return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
+
+    except subprocess.TimeoutExpired:
+        print("ERROR: FFmpeg extraction timed out after 5 minutes")
+        return None
+    except Exception as e:
+        print(f"ERROR extracting audio to memory: {e}")
+        return None
+
 def transcribe_audio_local(audio_path, language=None, model_size='base'):
     """
     Transcribe audio file locally using OpenAI Whisper with enhanced features.
@@ -2011,7 +2148,7 @@ def generate_audio_prompt(video_download):
         
         # Get AI provider settings
         try:
-            settings_obj = AIProviderSettings.objects.first()
+            settings_obj = AIProviderSettings.get_solo()
             if not settings_obj or not settings_obj.api_key:
                 return {
                     'prompt': '',
@@ -3299,7 +3436,7 @@ def generate_video_metadata(video_download):
         from django.utils import timezone
         
         # Check if AI provider is configured
-        settings_obj = AIProviderSettings.objects.first()
+        settings_obj = AIProviderSettings.get_solo()
         if not settings_obj or not settings_obj.api_key:
             return {
                 'title': '',
@@ -3523,7 +3660,7 @@ def generate_hindi_script(video_download):
         from django.utils import timezone
         
         # Check if AI provider is configured
-        settings_obj = AIProviderSettings.objects.first()
+        settings_obj = AIProviderSettings.get_solo()
         if not settings_obj or not settings_obj.api_key:
             return {
                 'script': '',
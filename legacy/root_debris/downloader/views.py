@@ -119,7 +119,7 @@ def ai_settings(request):
     """GET returns current AI provider settings, POST updates them."""
     if request.method == "GET":
         try:
-            settings = AIProviderSettings.objects.first()
+            settings = AIProviderSettings.get_solo()
             if not settings:
                 return JsonResponse({"provider": "gemini", "api_key": ""})
             return JsonResponse({"provider": settings.provider, "api_key": settings.api_key})
@@ -2,12 +2,10 @@
 Visual Frame Analysis Module
 Analyzes video frames using Gemini Vision API when no audio is present
 """
-import os
 import subprocess
-import tempfile
 import base64
 import requests
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from django.conf import settings
 from .utils import translate_text
 
@@ -46,73 +44,90 @@ def detect_audio_in_video(video_path):
         return True
 
 
-def extract_frames_at_intervals(video_path, interval_seconds=0.003, max_frames=None):
+# JPEG start-of-image / end-of-image markers used to split the MJPEG
+# stream into individual frames (0xFFD9 cannot occur inside entropy-coded
+# data thanks to JPEG byte stuffing, so a plain find() is safe)
+_JPEG_SOI = b'\xff\xd8'
+_JPEG_EOI = b'\xff\xd9'
+
+
+def extract_frames_batch(video_path, interval_seconds=0.003, max_frames=None):
     """
-    Extract frames from video at regular intervals
-    
+    Stream frames from video at regular intervals via a single ffmpeg process
+
+    One ffmpeg invocation pipes all frames as MJPEG to stdout, and the
+    stream is split on JPEG markers — no temp directory, no per-frame
+    files, and analysis can start on the first frame while ffmpeg is
+    still decoding the rest.
+
     Args:
         video_path: Path to video file
         interval_seconds: Extract frame every N seconds (default: 0.003 = 3 milliseconds)
         max_frames: Maximum number of frames to extract (None = no limit, extract all frames)
-        
-    Returns:
-        list: List of frame file paths
+
+    Yields:
+        tuple: (timestamp_seconds, jpeg_bytes) per extracted frame
     """
+    # -vf fps=1/N extracts 1 frame every N seconds; scale caps the frame
+    # width at 512px (the vision API downscales anyway), shrinking the
+    # base64 payload uploaded per frame
+    fps_filter = f"fps=1/{interval_seconds},scale='min(512,iw)':-2"
+
+    cmd = [
+        'ffmpeg',
+        '-i', video_path,
+        '-vf', fps_filter,
+        '-q:v', '2',  # High quality
+        '-f', 'image2pipe',
+        '-vcodec', 'mjpeg',
+    ]
+
+    # Only add max_frames limit if specified
+    if max_frames:
+        cmd += ['-frames:v', str(max_frames)]
+    cmd.append('-')
+
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=1 << 20
+    )
+    buffer = bytearray()
+    frame_idx = 0
     try:
-        # Create temp directory for frames
-        temp_dir = tempfile.mkdtemp(prefix='video_frames_')
-        output_pattern = os.path.join(temp_dir, 'frame_%04d.jpg')
-        
-        # Use ffmpeg to extract frames
-        # -vf fps=1/N extracts 1 frame every N seconds
-        # For 3 milliseconds (0.003 seconds), fps = 1/0.003 = 333.33 fps
-        fps_filter = f"fps=1/{interval_seconds}"
-        
-        cmd = [
-            'ffmpeg',
-            '-i', video_path,
-            '-vf', fps_filter,
-            '-q:v', '2',  # High quality
-            output_pattern
-        ]
-        
-        # Only add max_frames limit if specified
-        if max_frames:
-            cmd.insert(-1, '-frames:v')
-            cmd.insert(-1, str(max_frames))
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        
-        if result.returncode != 0:
-            print(f"ffmpeg error: {result.stderr}")
-            return []
-        
-        # Get list of extracted frames
-        frames = sorted(Path(temp_dir).glob('frame_*.jpg'))
-        frame_paths = [str(f) for f in frames]
-        
-        print(f"Extracted {len(frame_paths)} frames from video")
-        return frame_paths
-        
+        while True:
+            chunk = proc.stdout.read(64 * 1024)
+            if not chunk:
+                break
+            buffer += chunk
+            # Yield every complete SOI..EOI frame currently in the buffer
+            while True:
+                start = buffer.find(_JPEG_SOI)
+                if start < 0:
+                    break
+                end = buffer.find(_JPEG_EOI, start + 2)
+                if end < 0:
+                    break
+                yield frame_idx * interval_seconds, bytes(buffer[start:end + 2])
+                frame_idx += 1
+                del buffer[:end + 2]
     except Exception as e:
         print(f"Error extracting frames: {e}")
-        return []
+    finally:
+        proc.stdout.close()
+        proc.wait()
 
 
-def analyze_frame_with_gemini(frame_path, api_key, timestamp_seconds):
+def analyze_frame_with_gemini(frame, api_key, timestamp_seconds):
     """
     Analyze a single frame using Gemini Vision API
-    
+
     Args:
-        frame_path: Path to frame image
+        frame: JPEG bytes of the frame, or a path to a frame image
         api_key: Gemini API key
         timestamp_seconds: Timestamp of this frame in video
-        
+
     Returns:
         dict: {
             'timestamp': int,
@@ -121,10 +136,13 @@ def analyze_frame_with_gemini(frame_path, api_key, timestamp_seconds):
         }
     """
     try:
-        # Read and encode image
-        with open(frame_path, 'rb') as f:
-            image_data = base64.b64encode(f.read()).decode('utf-8')
-        
+        # Encode image (read from disk only if given a path)
+        if isinstance(frame, (bytes, bytearray)):
+            image_data = base64.b64encode(frame).decode('utf-8')
+        else:
+            with open(frame, 'rb') as f:
+                image_data = base64.b64encode(f.read()).decode('utf-8')
+
         # Format timestamp
         hours = int(timestamp_seconds // 3600)
         minutes = int((timestamp_seconds % 3600) // 60)
@@ -238,94 +256,40 @@ def generate_visual_transcript(video_path, api_key, interval=0.003, max_frames=N
     """
     try:
         print(f"Starting visual frame analysis for: {video_path}")
-        
-        # Extract frames
-        frame_paths = extract_frames_at_intervals(video_path, interval, max_frames)
-        
-        if not frame_paths:
-            return {
-                'status': 'failed',
-                'text': '',
-                'text_with_timestamps': '',
-                'segments': [],
-                'error': 'Could not extract frames from video'
-            }
-        
-        # Analyze each frame (batch processing for efficiency with many frames)
+
+        # Bounded concurrency replaces the old fixed per-frame sleeps:
+        # a few requests in flight at once instead of one request plus a
+        # 500ms pause per frame. The pool size is the rate-limit throttle.
+        concurrency = int(getattr(settings, 'VISUAL_ANALYSIS_CONCURRENCY', 4))
+
         segments = []
-        total_frames = len(frame_paths)
-        batch_size = 5  # Reduced batch size to avoid rate limits
         successful_frames = 0
         failed_frames = 0
         quota_errors = 0
-        import time
-        
-        print(f"Processing {total_frames} frames in batches of {batch_size}...")
-        
-        for batch_start in range(0, total_frames, batch_size):
-            batch_end = min(batch_start + batch_size, total_frames)
-            batch_frames = frame_paths[batch_start:batch_end]
-            
-            print(f"Analyzing frames {batch_start+1}-{batch_end}/{total_frames}...")
-            
-            for idx, frame_path in enumerate(batch_frames):
-                frame_idx = batch_start + idx
-                timestamp_seconds = frame_idx * interval
-                
-                # Check if frame file exists
-                if not os.path.exists(frame_path):
-                    print(f"⚠ Frame {frame_idx+1} file not found: {frame_path}")
+
+        # Submit frames as they stream out of the single ffmpeg process —
+        # the first API calls go out while ffmpeg is still decoding —
+        # then consume results in frame order so segments stay sorted.
+        futures = []
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='vision-frame') as pool:
+            for timestamp_seconds, frame_data in extract_frames_batch(video_path, interval, max_frames):
+                futures.append((
+                    timestamp_seconds,
+                    pool.submit(analyze_frame_with_gemini, frame_data, api_key, timestamp_seconds),
+                ))
+            total_frames = len(futures)
+            print(f"Analyzing {total_frames} frames ({concurrency} concurrent requests)...")
+
+            quota_abort_msg = None
+            for frame_idx, (timestamp_seconds, future) in enumerate(futures):
+                # After repeated quota errors, drop the remaining frames
+                if quota_abort_msg is not None:
+                    future.cancel()
                     failed_frames += 1
                     continue
-                
+
                 try:
-                    result = analyze_frame_with_gemini(frame_path, api_key, timestamp_seconds)
-                    
-                    # Check for quota/rate limit errors
-                    if result.get('is_quota_error'):
-                        quota_errors += 1
-                        error_msg = result.get('error', 'Quota exceeded')
-                        print(f"⚠ Frame {frame_idx+1} quota error: {error_msg[:100]}...")
-                        
-                        # If we hit quota limit, stop processing and return error
-                        if quota_errors >= 3:  # After 3 quota errors, stop
-                            return {
-                                'status': 'failed',
-                                'text': '',
-                                'text_with_timestamps': '',
-                                'segments': segments,
-                                'error': f'Gemini API quota exceeded. {quota_errors} frames failed due to quota limits. Please check your API quota or wait before retrying. Error: {error_msg[:200]}',
-                                'quota_exceeded': True
-                            }
-                        
-                        # Wait before retrying if retry_after is specified
-                        retry_after = result.get('retry_after')
-                        if retry_after and retry_after < 60:  # Only wait if less than 60 seconds
-                            print(f"Waiting {retry_after:.1f}s before next request...")
-                            time.sleep(retry_after)
-                        
-                        failed_frames += 1
-                        continue
-                    
-                    if result.get('error'):
-                        print(f"⚠ Frame {frame_idx+1} analysis error: {result['error'][:100]}")
-                        failed_frames += 1
-                        continue
-                    
-                    if result.get('description'):
-                        segments.append({
-                            'start': timestamp_seconds,
-                            'text': result['description'],
-                            'timestamp_str': result['timestamp_str']
-                        })
-                        successful_frames += 1
-                    else:
-                        failed_frames += 1
-                    
-                    # Add small delay between requests to avoid rate limits
-                    if idx < len(batch_frames) - 1:  # Don't delay after last frame in batch
-                        time.sleep(0.5)  # 500ms delay between frames
-                        
+                    result = future.result()
                 except Exception as api_error:
                     # Check if it's a requests exception
                     error_str = str(api_error)
@@ -337,28 +301,55 @@ def generate_visual_transcript(video_path, api_key, interval=0.003, max_frames=N
                         print(f"⚠ Frame {frame_idx+1} error: {api_error}")
                     failed_frames += 1
                     continue
-                except Exception as e:
-                    print(f"⚠ Error analyzing frame {frame_idx+1}: {e}")
+
+                # Check for quota/rate limit errors
+                if result.get('is_quota_error'):
+                    quota_errors += 1
+                    error_msg = result.get('error', 'Quota exceeded')
+                    print(f"⚠ Frame {frame_idx+1} quota error: {error_msg[:100]}...")
+
+                    # If we hit quota limit, stop processing and return error
+                    if quota_errors >= 3:  # After 3 quota errors, stop
+                        quota_abort_msg = error_msg
                     failed_frames += 1
                     continue
-            
-            # Add delay between batches
-            if batch_start + batch_size < total_frames:
-                time.sleep(1)  # 1 second delay between batches
-        
+
+                if result.get('error'):
+                    print(f"⚠ Frame {frame_idx+1} analysis error: {result['error'][:100]}")
+                    failed_frames += 1
+                    continue
+
+                if result.get('description'):
+                    segments.append({
+                        'start': timestamp_seconds,
+                        'text': result['description'],
+                        'timestamp_str': result['timestamp_str']
+                    })
+                    successful_frames += 1
+                else:
+                    failed_frames += 1
+
+        if quota_abort_msg is not None:
+            return {
+                'status': 'failed',
+                'text': '',
+                'text_with_timestamps': '',
+                'segments': segments,
+                'error': f'Gemini API quota exceeded. {quota_errors} frames failed due to quota limits. Please check your API quota or wait before retrying. Error: {quota_abort_msg[:200]}',
+                'quota_exceeded': True
+            }
+
+        if total_frames == 0:
+            return {
+                'status': 'failed',
+                'text': '',
+                'text_with_timestamps': '',
+                'segments': [],
+                'error': 'Could not extract frames from video'
+            }
+
         print(f"Frame analysis complete: {successful_frames} successful, {failed_frames} failed")
-        
-        # Clean up frame files
-        try:
-            for frame_path in frame_paths:
-                os.remove(frame_path)
-            # Remove temp directory
-            if frame_paths:
-                temp_dir = os.path.dirname(frame_paths[0])
-                os.rmdir(temp_dir)
-        except Exception as e:
-            print(f"Warning: Could not clean up temp frames: {e}")
-        
+
         if not segments:
             error_msg = f'No descriptions generated from {total_frames} frames. '
             if quota_errors > 0:
@@ -58,16 +58,17 @@ def load_whisper_model(model_name: str = "base"):
 
 def transcribe_with_whisper(
     model,
-    audio_path: str,
+    audio_path,
     task: str = "transcribe",
     language: Optional[str] = None
 ) -> Dict:
     """
     Transcribe audio and auto-detect language with time-aligned segments.
-    
+
     Args:
         model: Loaded Whisper model instance
-        audio_path: Path to audio file
+        audio_path: Path to audio file, or an in-memory 16kHz mono
+                    float32 array (whisper accepts both)
         task: 'transcribe' (keep original language) or 'translate' (translate to English)
         language: Optional language code to force (e.g., 'en', 'hi', 'zh'). 
                  If None, auto-detect language.
@@ -95,21 +96,25 @@ def transcribe_with_whisper(
         ...     print(f"{seg['start']:.2f}s - {seg['end']:.2f}s: {seg['text']}")
     """
     try:
-        if not os.path.exists(audio_path):
-            return {
-                'language': None,
-                'text': '',
-                'segments': [],
-                'status': 'failed',
-                'error': f'Audio file not found: {audio_path}'
-            }
-        
+        if isinstance(audio_path, str):
+            if not os.path.exists(audio_path):
+                return {
+                    'language': None,
+                    'text': '',
+                    'segments': [],
+                    'status': 'failed',
+                    'error': f'Audio file not found: {audio_path}'
+                }
+            source_desc = audio_path
+        else:
+            source_desc = f"<in-memory audio: {len(audio_path)} samples>"
+
         # Prepare transcription options
         options = {'task': task, 'verbose': False}
         if language:
             options['language'] = language
-        
-        print(f"Transcribing audio: {audio_path}")
+
+        print(f"Transcribing audio: {source_desc}")
         print(f"Options: task={task}, language={language or 'auto-detect'}")
         
         # Transcribe
@@ -185,16 +190,17 @@ def check_segment_confidence(segments: List[Dict], threshold: float = -1.5) -> T
 
 
 def retry_low_confidence_segments(
-    audio_path: str,
+    audio_path,
     segments: List[Dict],
     current_model_name: str,
     threshold: float = -1.5
 ) -> Dict:
     """
     Retry transcription of low-confidence segments with a larger model.
-    
+
     Args:
-        audio_path: Path to audio file
+        audio_path: Path to audio file or in-memory audio array
+                    (forwarded to transcribe_with_whisper)
         segments: List of segments from initial transcription
         current_model_name: Current model size used
         threshold: Confidence threshold for retry
@@ -119,23 +119,26 @@ class XTTSService:
             logger.error(f"Error generating speech: {str(e)}")
             raise e
 
+    # Static language table, shared across all calls
+    LANGUAGES = {
+        "English": "en",
+        "Hindi": "hi",
+        "Spanish": "es",
+        "French": "fr",
+        "German": "de",
+        "Italian": "it",
+        "Portuguese": "pt",
+        "Polish": "pl",
+        "Turkish": "tr",
+        "Russian": "ru",
+        "Dutch": "nl",
+        "Czech": "cs",
+        "Arabic": "ar",
+        "Chinese": "zh-cn",
+        "Japanese": "ja",
+        "Hungarian": "hu",
+        "Korean": "ko",
+    }
+
     def get_languages(self):
-        return {
-            "English": "en",
-            "Hindi": "hi",
-            "Spanish": "es",
-            "French": "fr",
-            "German": "de",
-            "Italian": "it",
-            "Portuguese": "pt",
-            "Polish": "pl",
-            "Turkish": "tr",
-            "Russian": "ru",
-            "Dutch": "nl",
-            "Czech": "cs",
-            "Arabic": "ar",
-            "Chinese": "zh-cn",
-            "Japanese": "ja",
-            "Hungarian": "hu",
-            "Korean": "ko",
-        }
+        return self.LANGUAGES
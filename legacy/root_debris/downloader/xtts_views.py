@@ -3,6 +3,7 @@ import uuid
 from django.conf import settings
 from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
+from django.db import transaction
 from rest_framework.views import APIView
 from rest_framework import viewsets
 from rest_framework.decorators import action
@@ -16,6 +17,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Maps display names sent from the frontend to XTTS language codes.
+# Static, so built once at import time rather than per request.
+LANGUAGE_NAME_TO_CODE = {
+    'english': 'en', 'hindi': 'hi', 'spanish': 'es', 'french': 'fr',
+    'german': 'de', 'italian': 'it', 'portuguese': 'pt', 'polish': 'pl',
+    'turkish': 'tr', 'russian': 'ru', 'dutch': 'nl', 'czech': 'cs',
+    'arabic': 'ar', 'chinese': 'zh-cn', 'japanese': 'ja', 'hungarian': 'hu',
+    'korean': 'ko'
+}
+
 class XTTSGenerateView(APIView):
     parser_classes = (MultiPartParser, FormParser)
 
@@ -37,17 +48,9 @@ class XTTSGenerateView(APIView):
         voice_id = request.data.get('voice_id')
         
         # Normalize language code - handle display names sent from frontend
-        language_map = {
-            'english': 'en', 'hindi': 'hi', 'spanish': 'es', 'french': 'fr',
-            'german': 'de', 'italian': 'it', 'portuguese': 'pt', 'polish': 'pl',
-            'turkish': 'tr', 'russian': 'ru', 'dutch': 'nl', 'czech': 'cs',
-            'arabic': 'ar', 'chinese': 'zh-cn', 'japanese': 'ja', 'hungarian': 'hu',
-            'korean': 'ko'
-        }
-        # Convert to lowercase for lookup
         language_lower = language.lower()
-        if language_lower in language_map:
-            language = language_map[language_lower]
+        if language_lower in LANGUAGE_NAME_TO_CODE:
+            language = LANGUAGE_NAME_TO_CODE[language_lower]
             logger.info(f"Converted language '{request.data.get('language')}' to code '{language}'")
         
         # Advanced parameters
@@ -160,7 +163,31 @@ class ClonedVoiceViewSet(viewsets.ModelViewSet):
         context = super().get_serializer_context()
         context['request'] = self.request
         return context
-    
+
+    def _save_with_default_swap(self, serializer):
+        """Save via the serializer, clearing any other default first.
+
+        is_default is writable through this serializer, so creates and
+        updates need the same atomic unset-then-set swap as set_default —
+        otherwise the uniq_default_voice constraint rejects the save when
+        another default already exists.
+        """
+        if serializer.validated_data.get('is_default'):
+            others = ClonedVoice.objects.filter(is_default=True)
+            if serializer.instance is not None:
+                others = others.exclude(pk=serializer.instance.pk)
+            with transaction.atomic():
+                others.update(is_default=False)
+                serializer.save()
+        else:
+            serializer.save()
+
+    def perform_create(self, serializer):
+        self._save_with_default_swap(serializer)
+
+    def perform_update(self, serializer):
+        self._save_with_default_swap(serializer)
+
     def list(self, request, *args, **kwargs):
         """List all cloned voices"""
         try:
@@ -248,11 +275,12 @@ class ClonedVoiceViewSet(viewsets.ModelViewSet):
         """Set a voice as default (only one default can exist)"""
         try:
             voice = self.get_object()
-            # Unset all other defaults
-            ClonedVoice.objects.filter(is_default=True).update(is_default=False)
-            # Set this voice as default
-            voice.is_default = True
-            voice.save()
+            # Swap atomically; the uniq_default_voice constraint enforces
+            # "at most one default" at the DB level
+            with transaction.atomic():
+                ClonedVoice.objects.filter(is_default=True).exclude(pk=voice.pk).update(is_default=False)
+                voice.is_default = True
+                voice.save()
             serializer = self.get_serializer(voice)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Exception as e: